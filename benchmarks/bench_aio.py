@@ -0,0 +1,66 @@
+"""
+Event loop responsiveness while slugifying long texts from a coroutine.
+
+A ticker task measures how late the event loop wakes it up while long documents are slugified
+inline with `slugify()`, and with `aslugify()` in a thread pool and in a process pool.
+
+    python -m benchmarks.bench_aio
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from slugify import aslugify, slugify
+
+from . import corpora
+
+TEXTS = corpora.long_documents(20)
+TICK = 0.001
+
+
+async def ticker(lags, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(loop.time() - expected)
+
+
+async def measure(slugify_all):
+    lags = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(TICK)
+    start = time.perf_counter()
+    await slugify_all()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await task
+    return elapsed, max(lags)
+
+
+async def main():
+    async def inline():
+        for text in TEXTS:
+            slugify(text)
+
+    async def offloaded(executor):
+        for text in TEXTS:
+            await aslugify(text, executor=executor)
+
+    print('{:<14} {:>10} {:>16}'.format('mode', 'total ms', 'max loop lag ms'))
+    with ThreadPoolExecutor(2) as threads, ProcessPoolExecutor(2) as processes:
+        # start the worker processes before timing
+        await aslugify(TEXTS[0], executor=processes)
+        modes = {
+            'inline': inline,
+            'thread pool': lambda: offloaded(threads),
+            'process pool': lambda: offloaded(processes),
+        }
+        for name, slugify_all in modes.items():
+            elapsed, lag = await measure(slugify_all)
+            print('{:<14} {:>10.1f} {:>16.2f}'.format(name, elapsed * 1e3, lag * 1e3))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+`slugify_array()` against slugifying every element of a column with many repeated values.
+
+NumPy and pandas columns are only benchmarked when those packages are installed.
+
+    python -m benchmarks.bench_array
+"""
+import random
+import time
+
+from slugify import slugify, slugify_array
+
+from . import corpora
+
+ROWS = 200000
+DISTINCT = (100, 10000, 100000)
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    try:
+        import pandas
+    except ImportError:
+        pandas = None
+
+    print('{:<8} {:>9} {:>14} {:>16} {:>8}'.format('input', 'distinct', 'per value ms', 'slugify_array ms', 'speedup'))
+    for distinct in DISTINCT:
+        titles = corpora.latin1_titles(distinct)
+        generator = random.Random(corpora.SEED)
+        column = [generator.choice(titles) for _ in range(ROWS)]
+        inputs = {'list': (column, lambda: [slugify(text) for text in column])}
+        if numpy is not None:
+            array = numpy.array(column, dtype=object)
+            inputs['numpy'] = (array, lambda: numpy.vectorize(slugify, otypes=[object])(array))
+        if pandas is not None:
+            series = pandas.Series(column)
+            inputs['pandas'] = (series, lambda: series.apply(slugify))
+        for name, (values, per_value) in inputs.items():
+            baseline = seconds(per_value)
+            vectorized = seconds(lambda: slugify_array(values))
+            print('{:<8} {:>9} {:>14.1f} {:>16.1f} {:>7.1f}x'.format(
+                name, distinct, baseline * 1e3, vectorized * 1e3, baseline / vectorized))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Cost of `slugify()` on ASCII-heavy corpora.
+
+Every title is timed as is (ASCII fast path) and with one accented character
+appended, which forces the full normalization and transliteration pipeline.
+
+    python -m benchmarks.bench_ascii
+"""
+import time
+
+from slugify import Slugifier
+
+ROWS = 50000
+
+CORPORA = {
+    'short titles': ['The quick brown fox #{}'.format(i) for i in range(ROWS)],
+    'long titles': ['How to configure the {} web server behind a load balancer, part {}'.format(i, i % 7)
+                    for i in range(ROWS)],
+    'html titles': ['Tom &amp; Jerry&#39;s {} &#x201C;best&#x201D; episodes'.format(i) for i in range(ROWS)],
+}
+
+
+def throughput(slugifier, texts):
+    start = time.perf_counter()
+    for text in texts:
+        slugifier(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    slugifier = Slugifier()
+    print('{:<14} {:>14} {:>14} {:>8}'.format('corpus', 'ascii rows/s', 'full rows/s', 'speedup'))
+    for name, texts in CORPORA.items():
+        fast = throughput(slugifier, texts)
+        full = throughput(slugifier, [text + ' é' for text in texts])
+        print('{:<14} {:>14.0f} {:>14.0f} {:>7.2f}x'.format(name, fast, full, fast / full))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Throughput of the command line tool on a large line-oriented input, serial and with `--jobs`.
+
+    python -m benchmarks.bench_cli
+    python -m benchmarks.bench_cli --rows 1000000 --jobs 2 4 8
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import corpora
+
+
+def run(path, extra_args):
+    with open(path, 'rb') as stdin:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'slugify', '--lines'] + extra_args,
+                       stdin=stdin, stdout=subprocess.DEVNULL, check=True)
+        return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Command line tool throughput')
+    parser.add_argument('--rows', type=int, default=200000, help='Input lines')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[2, 4, os.cpu_count() or 1],
+                        help='Worker process counts to compare with the serial run')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'titles.txt')
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.writelines(title + '\n' for title in corpora.latin1_titles(args.rows))
+
+        print('{} lines, {} CPUs'.format(args.rows, os.cpu_count()))
+        print('{:<10} {:>10} {:>12} {:>8}'.format('jobs', 'seconds', 'lines/s', 'speedup'))
+        serial = run(path, [])
+        print('{:<10} {:>10.2f} {:>12.0f} {:>7.2f}x'.format('serial', serial, args.rows / serial, 1))
+        for jobs in sorted(set(args.jobs)):
+            elapsed = run(path, ['--jobs', str(jobs)])
+            print('{:<10} {:>10.2f} {:>12.0f} {:>7.2f}x'.format(jobs, elapsed, args.rows / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
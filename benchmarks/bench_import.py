@@ -0,0 +1,56 @@
+"""
+Startup cost of `import slugify` and `python -m slugify`, measured with `python -X importtime`.
+
+Each command runs in a fresh interpreter, after a first untimed run and with bytecode caching on,
+so compiling the sources is not measured; the best of several runs is reported along with the
+cumulative import time of the `slugify` package and its five most expensive imports.
+
+    python -m benchmarks.bench_import
+"""
+import os
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+# bytecode is written and reused, as in an installed package
+ENV = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+
+COMMANDS = {
+    'import slugify': [sys.executable, '-X', 'importtime', '-c', 'import slugify'],
+    'python -m slugify': [sys.executable, '-X', 'importtime', '-m', 'slugify', 'Hello World'],
+}
+
+
+def parse_importtime(stderr):
+    """ Map each imported module to its cumulative import time in microseconds """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def run(command):
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, check=True, env=ENV)
+    return time.perf_counter() - start, parse_importtime(result.stderr)
+
+
+def main():
+    for label, command in COMMANDS.items():
+        run(command)
+        runs = [run(command) for _ in range(RUNS)]
+        wall, times = min(runs, key=lambda item: item[1].get('slugify', 0))
+        print('{}: best wall {:.1f} ms, slugify package {:.1f} ms'.format(
+            label, min(w for w, _ in runs) * 1e3, times.get('slugify', 0) / 1e3))
+        slowest = sorted(((t, name) for name, t in times.items() if name != 'slugify'), reverse=True)
+        for cumulative, name in slowest[:5]:
+            print('    {:>8.1f} ms  {}'.format(cumulative / 1e3, name))
+
+
+if __name__ == '__main__':
+    main()
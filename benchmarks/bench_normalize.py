@@ -0,0 +1,51 @@
+"""
+Unicode normalization cost on the NFKC path of `allow_unicode=True` (Japanese, Arabic, CJK and
+HTML titles) and on the NFKD path of the default transliterating pipeline.
+
+Reports throughput and the time `StageTimings` attributes to the first normalization and to
+the second one, which only runs when transliteration or entity decoding may have changed the text.
+
+    python -m benchmarks.bench_normalize
+"""
+import time
+
+from slugify import Slugifier, StageTimings
+
+from . import corpora
+
+ROWS = 50000
+
+SCENARIOS = {
+    'japanese NFKC': (corpora.japanese_titles, True),
+    'arabic NFKC': (corpora.arabic_titles, True),
+    'cjk NFKC': (corpora.cjk_titles, True),
+    'html NFKC': (corpora.html_titles, True),
+    'latin-1 NFKD': (corpora.latin1_titles, False),
+    'html NFKD': (corpora.html_titles, False),
+}
+
+
+def main():
+    print('{:<16} {:>12} {:>14} {:>16} {:>14}'.format(
+        'corpus', 'slugs/s', 'normalize ms', 'renormalize ms', 'renormalized'))
+    for name, (corpus, allow_unicode) in SCENARIOS.items():
+        texts = corpus(ROWS)
+        slugifier = Slugifier(allow_unicode=allow_unicode)
+
+        start = time.perf_counter()
+        for text in texts:
+            slugifier(text)
+        throughput = len(texts) / (time.perf_counter() - start)
+
+        with StageTimings() as timings:
+            for text in texts:
+                slugifier(text)
+        print('{:<16} {:>12.0f} {:>14.1f} {:>16.1f} {:>13.1f}%'.format(
+            name, throughput,
+            timings.totals.get('normalize', 0) * 1e3,
+            timings.totals.get('renormalize', 0) * 1e3,
+            100 * timings.counts.get('renormalize', 0) / len(texts)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Scaling of `slugify_parallel()` with the number of worker processes.
+
+    python -m benchmarks.bench_parallel
+"""
+import time
+
+from slugify import slugify_many, slugify_parallel
+
+ROWS = 200000
+WORKERS = [1, 2, 4, 8]
+CHUNK_SIZE = 2000
+
+WORDS = ['Déjà', 'vu', 'Компьютер', 'quick', 'brown', 'fox', '影師嗎', 'über', 'naïve', '100%']
+
+
+def corpus():
+    for i in range(ROWS):
+        yield ' '.join(WORDS[(i + j) % len(WORDS)] for j in range(8)) + ' #{}'.format(i)
+
+
+def timed(results):
+    start = time.perf_counter()
+    count = sum(1 for _ in results)
+    return count, time.perf_counter() - start
+
+
+def main():
+    count, serial = timed(slugify_many(corpus()))
+    print('{:>8} {:>10.2f} s {:>12.0f} rows/s'.format('serial', serial, count / serial))
+    for workers in WORKERS:
+        count, elapsed = timed(slugify_parallel(corpus(), workers=workers, chunksize=CHUNK_SIZE))
+        print('{:>8} {:>10.2f} s {:>12.0f} rows/s  x{:.2f}'.format(workers, elapsed, count / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+`SQLiteSlugCache` on a repeated batch run: the first run fills the database file, later runs
+(each opening the file again, as a nightly job would) only look slugs up.  Slugifying without
+a cache is the baseline.
+
+    python -m benchmarks.bench_persistent_cache
+    python -m benchmarks.bench_persistent_cache --rows 1000000 --batch-size 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from slugify import Slugifier, SQLiteSlugCache
+
+from . import corpora
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Persistent slug cache throughput')
+    parser.add_argument('--rows', type=int, default=200000, help='Titles per run')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Titles looked up and stored at once')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    # mostly distinct titles in several scripts, as in a site-wide reindex
+    titles = [title + ' ' + str(i) for i, title in enumerate(
+        corpora.latin1_titles(args.rows // 2) + corpora.cyrillic_titles(args.rows - args.rows // 2))]
+    slugifier = Slugifier()
+
+    print('{} titles, batches of {}'.format(args.rows, args.batch_size))
+    print('{:<14} {:>10} {:>12} {:>8}'.format('run', 'seconds', 'titles/s', 'speedup'))
+    baseline = seconds(lambda: [slugifier(title) for title in titles])
+    print('{:<14} {:>10.2f} {:>12.0f} {:>7.2f}x'.format('no cache', baseline, args.rows / baseline, 1))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'slugs.sqlite3')
+        for run in ('cold', 'warm', 'warm again'):
+            cache = SQLiteSlugCache(path, maxsize=2 * args.rows)
+            elapsed = seconds(lambda: list(cache.slugify_many(titles, batch_size=args.batch_size)))
+            cache.close()
+            print('{:<14} {:>10.2f} {:>12.0f} {:>7.2f}x'.format(run, elapsed, args.rows / elapsed, baseline / elapsed))
+        print('database size: {:.1f} MiB'.format(os.path.getsize(path) / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Cost of large `replacements` lists: `str.replace` loop versus `MultiReplacer`.
+
+    python -m benchmarks.bench_replacements
+"""
+import timeit
+
+from slugify import PRE_TRANSLATIONS, MultiReplacer, Slugifier, slugify
+
+NUMBER = 2000
+REPEAT = 5
+
+BRANDS = [('brand{:03}'.format(i), 'B{:03}'.format(i)) for i in range(300)]
+SYMBOLS = [('|', ' or '), ('%', ' percent '), ('&&', ' and '), ('@', ' at '), ('+', ' plus ')]
+RULES = BRANDS + SYMBOLS
+
+TEXT = 'Save 20% on brand017 && brand250 shoes | free shipping @ brand003 + more ' * 4
+CYRILLIC_TEXT = 'Щука ищет ёжика у хаты, Юля ясно видит ' * 4
+
+
+def sequential(rules, text):
+    for old, new in rules:
+        text = text.replace(old, new)
+    return text
+
+
+def best_of(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    replacer = MultiReplacer(RULES)
+    translator = MultiReplacer(PRE_TRANSLATIONS)
+    print('{} rules, {} characters'.format(len(RULES), len(TEXT)))
+    print('{:<32} {:>9.2f} us'.format('str.replace loop', best_of(lambda: sequential(RULES, TEXT))))
+    print('{:<32} {:>9.2f} us'.format('MultiReplacer', best_of(lambda: replacer(TEXT))))
+    print('{:<32} {:>9.2f} us'.format('PRE_TRANSLATIONS loop', best_of(lambda: sequential(PRE_TRANSLATIONS, CYRILLIC_TEXT))))
+    print('{:<32} {:>9.2f} us'.format('PRE_TRANSLATIONS MultiReplacer', best_of(lambda: translator(CYRILLIC_TEXT))))
+    slugifier = Slugifier(replacements=RULES)
+    print('{:<32} {:>9.2f} us'.format('Slugifier(replacements=...)', best_of(lambda: slugifier(TEXT))))
+    print('{:<32} {:>9.2f} us'.format('slugify(replacements=...)', best_of(lambda: slugify(TEXT, replacements=RULES))))
+
+
+if __name__ == '__main__':
+    main()
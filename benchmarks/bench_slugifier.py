@@ -0,0 +1,36 @@
+"""
+Per-call overhead of `slugify()` versus a prebuilt `Slugifier`.
+
+    python -m benchmarks.bench_slugifier
+"""
+import timeit
+
+from slugify import Slugifier, slugify
+
+NUMBER = 20000
+REPEAT = 5
+
+TEXT = 'The quick brown fox | jumps over 100% of the lazy dogs'
+OPTIONS = [
+    {},
+    {'max_length': 30, 'word_boundary': True},
+    {'stopwords': ['the', 'of', 'over'], 'replacements': [['|', 'or'], ['%', 'percent']]},
+    {'regex_pattern': r'[^-a-z0-9_]+', 'separator': '_'},
+]
+
+
+def best_of(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    print('{:>12} {:>12}  {}'.format('slugify()', 'Slugifier', 'options'))
+    for options in OPTIONS:
+        slugifier = Slugifier(**options)
+        function_time = best_of(lambda: slugify(TEXT, **options))
+        slugifier_time = best_of(lambda: slugifier(TEXT))
+        print('{:>9.2f} us {:>9.2f} us  {!r}'.format(function_time, slugifier_time, options))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Transliteration backends on multilingual corpora: `unidecode`, `text_unidecode` and
+`TableTransliterator` wrapping each of them (cold first pass, then warm).
+
+    python -m benchmarks.bench_transliteration
+"""
+import importlib
+import time
+
+from slugify import TableTransliterator
+
+ROWS = 20000
+
+SAMPLES = {
+    'latin-1': 'Crème brûlée à la française, naïve façade, Ærøskøbing',
+    'cyrillic': 'Съешь же ещё этих мягких французских булок, да выпей чаю',
+    'greek': 'Ξεσκεπάζω την ψυχοφθόρα βδελυγμία των υπερυψωμένων',
+    'cjk': '影師嗎 東京都の天気予報 北京欢迎你 서울특별시 날씨',
+    'mixed': 'Déjà vu — Компьютер — 影師嗎 — Χάος — über',
+}
+
+
+def corpus(sample):
+    return ['{} {}'.format(sample, i) for i in range(ROWS)]
+
+
+def throughput(transliterate, texts):
+    start = time.perf_counter()
+    for text in texts:
+        transliterate(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def backends():
+    for module_name in ('unidecode', 'text_unidecode'):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            print('{} is not installed, skipped'.format(module_name))
+            continue
+        yield module_name, module.unidecode
+
+
+def main():
+    print('{:<16} {:<10} {:>12} {:>12} {:>12}'.format('backend', 'corpus', 'plain/s', 'table cold/s', 'table warm/s'))
+    for name, backend in backends():
+        for corpus_name, sample in SAMPLES.items():
+            texts = corpus(sample)
+            plain = throughput(backend, texts)
+            table = TableTransliterator(backend)
+            cold = throughput(table, texts[:1])
+            warm = throughput(table, texts)
+            print('{:<16} {:<10} {:>12.0f} {:>12.0f} {:>12.0f}'.format(name, corpus_name, plain, cold, warm))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Cost of `smart_truncate()` and `max_length` on multi-megabyte inputs.
+
+Small budgets should only cost a scan of the beginning of the text, large budgets should
+grow linearly with the size of the result.  Slugifying the whole text with `max_length` should
+cost time and memory in proportion to `max_length` rather than to the size of the text.
+
+    python -m benchmarks.bench_truncate
+"""
+import random
+import time
+import tracemalloc
+
+from slugify import smart_truncate, Slugifier
+
+from .corpora import ASCII_WORDS, SEED
+
+SIZES_MB = (1, 4, 16)
+MAX_LENGTHS = (10, 60, 255, 100000)
+
+
+def document(size):
+    generator = random.Random(SEED)
+    words = []
+    length = 0
+    while length < size:
+        word = generator.choice(ASCII_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return '-'.join(words)
+
+
+def seconds(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print('{:>7} {:>10} {:>16} {:>16} {:>14} {:>14}'.format(
+        'size MB', 'max_length', 'save_order ms', 'any order ms', 'slugify ms', 'slugify KiB'))
+    for size in SIZES_MB:
+        text = document(size * 1024 * 1024)
+        for max_length in MAX_LENGTHS:
+            ordered = seconds(lambda: smart_truncate(text, max_length, True, '-', True))
+            unordered = seconds(lambda: smart_truncate(text, max_length, True, '-', False))
+            slugifier = Slugifier(max_length=max_length, word_boundary=True)
+            full = seconds(lambda: slugifier(text), repeat=1)
+            tracemalloc.start()
+            slugifier(text)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print('{:>7} {:>10} {:>16.3f} {:>16.3f} {:>14.3f} {:>14.1f}'.format(
+                size, max_length, ordered * 1e3, unordered * 1e3, full * 1e3, peak / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Fixed synthetic corpora for the benchmarks.
+
+Every corpus is generated from a seeded random generator, so runs on different machines
+or commits slugify exactly the same texts.
+"""
+import random
+
+SEED = 20240101
+
+ASCII_WORDS = [
+    'the', 'quick', 'brown', 'fox', 'jumps', 'over', 'lazy', 'dog', 'how', 'to', 'build', 'a',
+    'python', 'web', 'server', 'guide', 'best', 'practices', 'for', 'release', 'notes', 'version',
+    'update', 'news', 'review', 'top', '10', 'reasons', 'why', 'you', 'should', 'learn', 'data',
+]
+LATIN1_WORDS = [
+    'crème', 'brûlée', 'à', 'la', 'française', 'naïve', 'façade', 'déjà', 'vu', 'über', 'schön',
+    'mañana', 'niño', 'São', 'Paulo', 'Ærøskøbing', 'smörgåsbord', 'jalapeño', 'café', 'coöperate',
+]
+CYRILLIC_WORDS = [
+    'Съешь', 'же', 'ещё', 'этих', 'мягких', 'французских', 'булок', 'да', 'выпей', 'чаю',
+    'Компьютер', 'щука', 'ёжик', 'юла', 'хата', 'Москва', 'новости',
+]
+GREEK_WORDS = [
+    'Ξεσκεπάζω', 'την', 'ψυχοφθόρα', 'βδελυγμία', 'των', 'υπερυψωμένων', 'Χάος', 'ύδωρ',
+    'Αθήνα', 'ειδήσεις', 'καλημέρα',
+]
+CJK_WORDS = [
+    '影師嗎', '東京都', 'の', '天気予報', '北京', '欢迎你', '서울특별시', '날씨', '日本語', '中文', '新闻',
+]
+JAPANESE_WORDS = [
+    '東京都', 'の', '天気予報', 'ニュース', 'ひらがな', 'カタカナ', 'ｶﾀｶﾅ', 'ﾃｽﾄ', '日本語', '①', 'ＡＢＣ', '２０２４年',
+]
+ARABIC_WORDS = [
+    'مرحبا', 'بالعالم', 'السلام', 'عليكم', 'الأخبار', 'مَرْحَبًا', 'كِتَاب', 'ﻻ', 'ﷲ', 'القاهرة', '٢٠٢٤',
+]
+EMOJI_WORDS = ['i', 'love', '🦄', '🎉', 'party', '🔥', 'hot', 'deals', '👍', '🇫🇷', 'flag', '❤️']
+ENTITIES = ['&amp;', '&lt;', '&gt;', '&quot;', '&eacute;', '&nbsp;', '&#381;', '&#x17D;', '&#8212;', '&hellip;']
+
+STOPWORDS = ASCII_WORDS[:8] + ['stop{}'.format(i) for i in range(500)]
+REPLACEMENTS = [('brand{:03}'.format(i), 'B{:03}'.format(i)) for i in range(300)] + [
+    ('|', ' or '), ('%', ' percent '), ('&&', ' and '), ('@', ' at '), ('+', ' plus '),
+]
+
+
+def _sentences(words, rows, min_words, max_words, seed=SEED):
+    generator = random.Random(seed)
+    return [' '.join(generator.choice(words) for _ in range(generator.randint(min_words, max_words)))
+            for _ in range(rows)]
+
+
+def ascii_titles(rows):
+    return _sentences(ASCII_WORDS, rows, 3, 10)
+
+
+def latin1_titles(rows):
+    return _sentences(ASCII_WORDS + LATIN1_WORDS, rows, 3, 10)
+
+
+def cyrillic_titles(rows):
+    return _sentences(CYRILLIC_WORDS, rows, 3, 10)
+
+
+def greek_titles(rows):
+    return _sentences(GREEK_WORDS, rows, 3, 10)
+
+
+def cjk_titles(rows):
+    return _sentences(CJK_WORDS, rows, 2, 8)
+
+
+def japanese_titles(rows):
+    return _sentences(JAPANESE_WORDS, rows, 2, 8)
+
+
+def arabic_titles(rows):
+    return _sentences(ARABIC_WORDS, rows, 3, 10)
+
+
+def emoji_titles(rows):
+    return _sentences(EMOJI_WORDS + ASCII_WORDS, rows, 3, 10)
+
+
+def html_titles(rows):
+    return _sentences(ASCII_WORDS + LATIN1_WORDS + ENTITIES, rows, 5, 15)
+
+
+def long_documents(rows):
+    return _sentences(ASCII_WORDS + LATIN1_WORDS + CYRILLIC_WORDS, rows, 2000, 4000)
+
+
+def existing_slugs(rows):
+    """ Texts which already are slugs, as URL path segments and upstream ids """
+    return [title.replace(' ', '-') for title in _sentences(ASCII_WORDS, rows, 2, 8)]
+
+
+def stopword_titles(rows):
+    return _sentences(ASCII_WORDS + STOPWORDS[8:40], rows, 5, 15)
+
+
+def replacement_titles(rows):
+    words = ASCII_WORDS + [old for old, _ in REPLACEMENTS[::10]] + ['|', '%', '@', '+']
+    return _sentences(words, rows, 5, 15)
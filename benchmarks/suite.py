@@ -0,0 +1,152 @@
+"""
+Benchmark suite for the slugify pipeline on fixed synthetic corpora.
+
+Reports throughput, latency percentiles and peak memory per scenario, and can save the
+results as JSON and compare them with an earlier run:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from slugify import __version__, slugify, smart_truncate, Slugifier, default_transliterator
+
+from . import corpora
+
+# name: (corpus, number of rows relative to --rows, function building the callable)
+SCENARIOS = {
+    'ascii-titles': (corpora.ascii_titles, 1, lambda: Slugifier()),
+    'latin1-titles': (corpora.latin1_titles, 1, lambda: Slugifier()),
+    'cyrillic-titles': (corpora.cyrillic_titles, 1, lambda: Slugifier()),
+    'greek-titles': (corpora.greek_titles, 1, lambda: Slugifier()),
+    'cjk-titles': (corpora.cjk_titles, 1, lambda: Slugifier()),
+    'cjk-titles-unicode': (corpora.cjk_titles, 1, lambda: Slugifier(allow_unicode=True)),
+    'japanese-titles-unicode': (corpora.japanese_titles, 1, lambda: Slugifier(allow_unicode=True)),
+    'arabic-titles-unicode': (corpora.arabic_titles, 1, lambda: Slugifier(allow_unicode=True)),
+    'existing-slugs': (corpora.existing_slugs, 1, lambda: Slugifier()),
+    'emoji-titles': (corpora.emoji_titles, 1, lambda: Slugifier()),
+    'html-titles': (corpora.html_titles, 1, lambda: Slugifier()),
+    'long-documents-max-length': (corpora.long_documents, 0.01,
+                                  lambda: Slugifier(max_length=60, word_boundary=True)),
+    'stopwords': (corpora.stopword_titles, 1, lambda: Slugifier(stopwords=corpora.STOPWORDS)),
+    'replacements': (corpora.replacement_titles, 1, lambda: Slugifier(replacements=corpora.REPLACEMENTS)),
+    # `slugify()` with the options on every call, as most callers use it
+    'replacements-slugify': (corpora.replacement_titles, 1,
+                             lambda: lambda text: slugify(text, replacements=corpora.REPLACEMENTS)),
+    'smart-truncate': (corpora.long_documents, 0.01,
+                       lambda: lambda text: smart_truncate(text, 60, True, ' ')),
+}
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, rows, repeat):
+    corpus, scale, build = SCENARIOS[name]
+    texts = corpus(max(1, int(rows * scale)))
+    func = build()
+
+    # warm up caches and lazily loaded resources
+    for text in texts[:100]:
+        func(text)
+
+    best_total = None
+    latencies = []
+    for _ in range(repeat):
+        run_latencies = []
+        clock = time.perf_counter_ns
+        start = clock()
+        for text in texts:
+            before = clock()
+            func(text)
+            run_latencies.append(clock() - before)
+        total = clock() - start
+        if best_total is None or total < best_total:
+            best_total, latencies = total, run_latencies
+
+    tracemalloc.start()
+    for text in texts:
+        func(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'rows': len(texts),
+        'chars': sum(len(text) for text in texts),
+        'throughput_per_s': len(texts) / (best_total / 1e9),
+        'latency_us': {
+            'mean': statistics.fmean(latencies) / 1e3,
+            'p50': percentile(latencies, 0.50) / 1e3,
+            'p90': percentile(latencies, 0.90) / 1e3,
+            'p99': percentile(latencies, 0.99) / 1e3,
+            'max': latencies[-1] / 1e3,
+        },
+        'peak_memory_kib': peak / 1024,
+    }
+
+
+def environment():
+    backend = default_transliterator()
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'slugify': __version__,
+        'transliteration': backend.__module__,
+    }
+
+
+def print_results(results, baseline=None):
+    header = '{:<28} {:>8} {:>12} {:>9} {:>9} {:>9} {:>10}'.format(
+        'scenario', 'rows', 'rows/s', 'p50 us', 'p90 us', 'p99 us', 'peak KiB')
+    if baseline:
+        header += ' {:>9}'.format('vs base')
+    print(header)
+    for name, result in results.items():
+        latency = result['latency_us']
+        line = '{:<28} {:>8} {:>12.0f} {:>9.2f} {:>9.2f} {:>9.2f} {:>10.1f}'.format(
+            name, result['rows'], result['throughput_per_s'], latency['p50'], latency['p90'],
+            latency['p99'], result['peak_memory_kib'])
+        if baseline and name in baseline:
+            line += ' {:>8.2f}x'.format(result['throughput_per_s'] / baseline[name]['throughput_per_s'])
+        print(line)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Slugify benchmark suite')
+    parser.add_argument('--rows', type=int, default=20000, help='Rows per title corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per scenario, the best is kept')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Scenario to run, may be repeated; all by default')
+    parser.add_argument('--output', help='Save the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of an earlier run to compare throughput with')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    names = args.scenario or list(SCENARIOS)
+    results = {name: run_scenario(name, args.rows, args.repeat) for name in names}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fp:
+            baseline = json.load(fp)['results']
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fp:
+            json.dump({'environment': environment(), 'args': vars(args), 'results': results}, fp, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,15 @@
+from typing import TYPE_CHECKING
+
 from .special import *
+from .special import __all__ as _special_all
 from .slugify import *
+from .slugify import __all__ as _slugify_all
+from .replacements import *
+from .replacements import __all__ as _replacements_all
+from .transliteration import *
+from .transliteration import __all__ as _transliteration_all
+from .timing import *
+from .timing import __all__ as _timing_all
 from .__version__ import __title__
 from .__version__ import __author__
 from .__version__ import __author_email__
@@ -8,3 +18,51 @@ from .__version__ import __url__
 from .__version__ import __license__
 from .__version__ import __copyright__
 from .__version__ import __version__
+
+if TYPE_CHECKING:
+    from .options import *
+    from .cache import *
+    from .batch import *
+    from .unique import *
+    from .aio import *
+    from .array import *
+
+# The optional APIs below are only imported on first use, so `import slugify` only pays for
+# the modules `slugify()` itself needs.
+_LAZY_NAMES = {
+    'SlugifyOptions': 'options',
+    'SlugCache': 'cache',
+    'SQLiteSlugCache': 'cache',
+    'CacheInfo': 'cache',
+    'slugify_many': 'batch',
+    'slugify_parallel': 'batch',
+    'SlugStore': 'unique',
+    'MemorySlugStore': 'unique',
+    'SQLiteSlugStore': 'unique',
+    'UniqueSlugAllocator': 'unique',
+    'aslugify': 'aio',
+    'aslugify_many': 'aio',
+    'slugify_array': 'array',
+}
+
+__all__ = [
+    *_special_all,
+    *_slugify_all,
+    *_replacements_all,
+    *_transliteration_all,
+    *_timing_all,
+    *_LAZY_NAMES,
+]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_NAMES:
+        from importlib import import_module
+        value = getattr(import_module('.' + _LAZY_NAMES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_NAMES})
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import io
+import json
+import os
 import sys
-from typing import Any
+from collections.abc import Iterator
+from typing import IO, Any, cast
 
-from .slugify import slugify, DEFAULT_SEPARATOR
+from .slugify import slugify, Slugifier, DEFAULT_SEPARATOR
+from .special import LANGUAGE_PROFILES
+
+READ_SIZE = 65536
+BUFFER_SIZE = 1024 * 1024
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -15,6 +24,19 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
                              help='Text to slugify')
     input_group.add_argument("--stdin", action='store_true',
                              help="Take the text from STDIN")
+    input_group.add_argument("--lines", action='store_true',
+                             help="Slugify each line of STDIN, one slug per line")
+    input_group.add_argument("-z", "--null", action='store_true',
+                             help="Like --lines with NUL-delimited input and output, e.g. for xargs -0")
+    input_group.add_argument("--format", choices=['csv', 'jsonl'],
+                             help="Read CSV or JSON Lines from STDIN and add the slugs of --fields to each record")
+    input_group.add_argument("--fields", nargs='+',
+                             help="Columns or fields to slugify with --format")
+    input_group.add_argument("--output-field", default='{field}_slug',
+                             help="Column or field receiving each slug, {field} is the name of the slugified one. "
+                                  "By default {field}_slug")
+    input_group.add_argument("--jobs", type=int, default=1,
+                             help="Worker processes for --lines and --null, 0 for one per CPU. By default 1")
 
     parser.add_argument("--no-entities", action='store_false', dest='entities', default=True,
                         help="Do not convert HTML entities to unicode")
@@ -40,12 +62,34 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
                         help="""Additional replacement rules e.g. "|->or", "%%->percent".""")
     parser.add_argument("--allow-unicode", action='store_true', default=False,
                         help="Allow unicode characters")
+    parser.add_argument("--pre-translations", nargs='+', default=[],
+                        help="Language profiles to apply before transliteration e.g. cyrillic german greek")
 
     args = parser.parse_args(argv[1:])
 
     if args.input_string and args.stdin:
         parser.error("Input strings and --stdin cannot work together")
 
+    if args.null:
+        args.lines = True
+    if args.lines and (args.input_string or args.stdin):
+        parser.error("--lines and --null read STDIN and cannot work with input strings or --stdin")
+    if args.format and (args.input_string or args.stdin or args.lines):
+        parser.error("--format reads STDIN and cannot work with input strings, --stdin, --lines or --null")
+    if bool(args.format) != bool(args.fields):
+        parser.error("--format and --fields must be used together")
+    if args.fields and len(args.fields) > 1 and '{field}' not in args.output_field:
+        parser.error("--output-field must contain {field} when several --fields are given")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.jobs != 1 and not args.lines:
+        parser.error("--jobs only works with --lines or --null")
+
+    unknown = [language for language in args.pre_translations if language not in LANGUAGE_PROFILES]
+    if unknown:
+        parser.error("Unknown language profile(s): {}, expected some of: {}".format(
+            ', '.join(unknown), ', '.join(sorted(LANGUAGE_PROFILES))))
+
     if args.replacements:
         def split_check(repl: str) -> list[str]:
             SEP = '->'
@@ -76,12 +120,92 @@ def slugify_params(args: argparse.Namespace) -> dict[str, Any]:
         save_order=args.save_order,
         separator=args.separator,
         stopwords=args.stopwords,
+        regex_pattern=args.regex_pattern,
         lowercase=args.lowercase,
         replacements=args.replacements,
-        allow_unicode=args.allow_unicode
+        allow_unicode=args.allow_unicode,
+        pre_translations=args.pre_translations
     )
 
 
+def read_records(stream: IO[str], delimiter: str, size: int = READ_SIZE) -> Iterator[str]:
+    """
+    Lazily read delimited records, holding at most one record and one read in memory.
+    :param stream (file): text stream
+    :param delimiter (str): record delimiter, a final one is optional
+    :param size (int): number of characters read at once
+    :return (iterator): records without their delimiter
+    """
+    parts: list[str] = []
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        *records, rest = chunk.split(delimiter)
+        if records:
+            records[0] = ''.join(parts) + records[0]
+            parts = []
+            yield from records
+        parts.append(rest)
+    last = ''.join(parts)
+    if last:
+        yield last
+
+
+def open_std_stream(stream: IO[str], mode: str) -> IO[str]:
+    """
+    Reopen a standard stream as UTF-8 with a large buffer and without newline translation, as csv expects.
+    Streams without a file descriptor (e.g. in tests) are used as they are.
+    """
+    try:
+        fileno = stream.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return stream
+    stream.flush()
+    return open(fileno, mode, encoding='utf-8', newline='', buffering=BUFFER_SIZE, closefd=False)
+
+
+def slugify_csv(slugifier: Slugifier, fields: list[str], output_field: str, source: IO[str], target: IO[str]) -> None:
+    """ Copy CSV rows from source to target, adding the slugs of some columns """
+    reader = csv.DictReader(source)
+    if reader.fieldnames is None:
+        return
+    missing = [field for field in fields if field not in reader.fieldnames]
+    if missing:
+        raise ValueError("unknown column(s): {}".format(', '.join(missing)))
+    outputs = [output_field.format(field=field) for field in fields]
+    fieldnames = list(reader.fieldnames) + [output for output in outputs if output not in reader.fieldnames]
+    writer = csv.DictWriter(target, fieldnames)
+    writer.writeheader()
+    for row in reader:
+        # cells past the header are collected under None, they have no column to be written to
+        if None in row:
+            raise ValueError("line {}: too many fields".format(reader.line_num))
+        for field, output in zip(fields, outputs):
+            row[output] = slugifier(row[field] or '')
+        writer.writerow(row)
+
+
+def slugify_jsonl(slugifier: Slugifier, fields: list[str], output_field: str, source: IO[str], target: IO[str]) -> None:
+    """ Copy JSON Lines objects from source to target, adding the slugs of some fields """
+    outputs = [output_field.format(field=field) for field in fields]
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise ValueError("line {}: {}".format(number, error))
+        if not isinstance(record, dict):
+            raise ValueError("line {}: not a JSON object".format(number))
+        for field, output in zip(fields, outputs):
+            value = record.get(field)
+            # missing and null values stay null, numbers are slugified as text
+            record[output] = None if value is None else slugifier(value if isinstance(value, str) else str(value))
+        target.write(json.dumps(record, ensure_ascii=False))
+        target.write('\n')
+
+
 def main(argv: list[str] | None = None) -> None:
     """ Run this program """
     if argv is None:
@@ -89,9 +213,36 @@ def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
     params = slugify_params(args)
     try:
-        print(slugify(**params))
+        if args.lines:
+            delimiter = '\0' if args.null else '\n'
+            del params['text']
+            records = read_records(sys.stdin, delimiter)
+            slugs: Iterator[str]
+            if args.jobs == 1:
+                slugs = map(Slugifier(**params), records)
+            else:
+                from .batch import slugify_parallel
+                # the options are sent once to each worker, records in chunks, slugs come back in order
+                slugs = cast(Iterator[str], slugify_parallel(records, workers=args.jobs or None, **params))
+            sys.stdout.writelines(slug + delimiter for slug in slugs)
+            sys.stdout.flush()
+        elif args.format:
+            del params['text']
+            convert = slugify_csv if args.format == 'csv' else slugify_jsonl
+            source, target = open_std_stream(sys.stdin, 'r'), open_std_stream(sys.stdout, 'w')
+            try:
+                convert(Slugifier(**params), args.fields, args.output_field, source, target)
+            except ValueError as error:
+                sys.exit("slugify: {}".format(error))
+            target.flush()
+        else:
+            print(slugify(**params))
     except KeyboardInterrupt:
         sys.exit(-1)
+    except BrokenPipeError:
+        # the reader has gone (e.g. `| head`), keep Python from failing again when flushing at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .batch import _NO_KEY, _split_item
+from .slugify import Slugifier
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from concurrent.futures import Executor
+
+__all__ = ['aslugify', 'aslugify_many']
+
+# texts up to this many characters are slugified inline, longer ones in an executor
+INLINE_MAX_LENGTH = 2000
+DEFAULT_CONCURRENCY = 8
+
+
+async def _slugify(slugifier: Slugifier, text: str, executor: Executor | None, inline_max_length: int) -> str:
+    if len(text) <= inline_max_length:
+        return slugifier(text)
+    # a running loop means asyncio is loaded already, importing it here keeps it out of `import slugify`
+    from asyncio import get_running_loop
+    return await get_running_loop().run_in_executor(executor, slugifier, text)
+
+
+async def aslugify(
+    text: str,
+    executor: Executor | None = None,
+    inline_max_length: int = INLINE_MAX_LENGTH,
+    **options: Any,
+) -> str:
+    """
+    Make a slug from the given text without blocking the event loop on long texts.
+    Texts up to `inline_max_length` characters are slugified right away, longer ones in the executor.
+    :param text (str): initial text
+    :param executor (Executor): executor for long texts, the event loop's default executor by default
+    :param inline_max_length (int): longest text slugified inline
+    :param options: any keyword argument accepted by `slugify()`
+    :return (str):
+    """
+    return await _slugify(Slugifier(**options), text, executor, inline_max_length)
+
+
+async def _iterate(iterable: AsyncIterable[Any] | Iterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def _slugify_stream(
+    slugifier: Slugifier,
+    iterable: AsyncIterable[Any] | Iterable[Any],
+    executor: Executor | None,
+    concurrency: int,
+    inline_max_length: int,
+) -> AsyncIterator[Any]:
+    from asyncio import get_running_loop
+    loop = get_running_loop()
+    # slugs or pending executor jobs in input order, at most `concurrency` of them
+    pending: deque[tuple[Any, str | Future[str]]] = deque()
+    try:
+        async for item in _iterate(iterable):
+            key, text = _split_item(item)
+            if len(text) <= inline_max_length:
+                pending.append((key, slugifier(text)))
+            else:
+                pending.append((key, loop.run_in_executor(executor, slugifier, text)))
+            # the input is not read any further while the queue is full
+            while pending and (len(pending) >= concurrency or isinstance(pending[0][1], str) or pending[0][1].done()):
+                key, result = pending.popleft()
+                slug = result if isinstance(result, str) else await result
+                yield slug if key is _NO_KEY else (key, slug)
+        while pending:
+            key, result = pending.popleft()
+            slug = result if isinstance(result, str) else await result
+            yield slug if key is _NO_KEY else (key, slug)
+    finally:
+        for _, result in pending:
+            if not isinstance(result, str):
+                result.cancel()
+
+
+def aslugify_many(
+    iterable: AsyncIterable[str | tuple[Any, str]] | Iterable[str | tuple[Any, str]],
+    executor: Executor | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    inline_max_length: int = INLINE_MAX_LENGTH,
+    **options: Any,
+) -> AsyncIterator[str | tuple[Any, str]]:
+    """
+    Lazily slugify every item of an async (or regular) iterable.
+    Options are prepared once, long texts are slugified in the executor and slugs are yielded
+    in input order as soon as they are ready.  At most `concurrency` items are buffered, the
+    input is not read further until the oldest of them is consumed.
+    :param iterable (iterable): texts, or (key, text) pairs which are yielded back as (key, slug),
+        single column rows are read as their text
+    :param executor (Executor): executor for long texts, the event loop's default executor by default
+    :param concurrency (int): maximum number of items being slugified or waiting to be consumed
+    :param inline_max_length (int): longest text slugified inline
+    :param options: any keyword argument accepted by `slugify()`
+    :return (async iterator): slugs in input order
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    return _slugify_stream(Slugifier(**options), iterable, executor, concurrency, inline_max_length)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from typing import Any
+
+from .slugify import Slugifier
+
+__all__ = ['slugify_array']
+
+
+def _factorize(values: Iterable[Any]) -> tuple[list[int], list[Any]]:
+    """ Codes of the values, indexes in the list of their unique values in order of appearance """
+    index: dict[Any, int] = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return codes, list(index)
+
+
+def _slugify_values(slugifier: Slugifier, values: list[Any]) -> list[Any]:
+    slugs = []
+    for value in values:
+        if isinstance(value, bytes):
+            value = str(value, 'utf-8', 'ignore')
+        slugs.append(slugifier(value) if isinstance(value, str) else value)
+    return slugs
+
+
+def _take(numpy: Any, slugs: list[Any], codes: Any) -> Any:
+    """ Map slugs of the unique values back to every value through the codes index array """
+    unique_slugs = numpy.empty(len(slugs), dtype=object)
+    unique_slugs[:] = slugs
+    return unique_slugs.take(numpy.asarray(codes, dtype=numpy.intp))
+
+
+def slugify_array(values: Any, **options: Any) -> Any:
+    """
+    Slugify every value of an array, slugifying each distinct value only once.
+    Values which are not text (None, NaN) are kept as they are.
+    :param values: NumPy array, pandas Series or any iterable of texts
+    :param options: any keyword argument accepted by `slugify()`
+    :return: array of the same shape for a NumPy array, Series with the same index for a pandas
+        Series, list otherwise
+    """
+    slugifier = Slugifier(**options)
+
+    # numpy and pandas are optional: an array of theirs can only be given once they are imported,
+    # and pandas always imports numpy
+    numpy = sys.modules.get('numpy')
+    pandas = sys.modules.get('pandas')
+
+    if pandas is not None and isinstance(values, pandas.Series):
+        codes, uniques = pandas.factorize(values)
+        # missing values get the code -1, which takes the missing value appended to the slugs
+        result = _take(numpy, _slugify_values(slugifier, uniques.tolist()) + [None], codes)
+        return pandas.Series(result, index=values.index, name=values.name)
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        codes, uniques = _factorize(values.ravel().tolist())
+        result = _take(numpy, _slugify_values(slugifier, uniques), codes).reshape(values.shape)
+        if values.dtype.kind in 'US':
+            return result.astype(str)
+        return result
+
+    codes, uniques = _factorize(values)
+    slugs = _slugify_values(slugifier, uniques)
+    return [slugs[code] for code in codes]
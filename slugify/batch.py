@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .slugify import Slugifier
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = ['slugify_many', 'slugify_parallel']
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# slugifier of the current worker process, set up once by the pool initializer
+_worker_slugifier: Slugifier | None = None
+
+# marks items of a stream which are not (key, text) pairs
+_NO_KEY = object()
+
+
+def _split_item(item: Any) -> tuple[Any, Any]:
+    """ Key and text of a stream item: a (key, text) pair, a single column row such as `(text,)` or a text """
+    if isinstance(item, tuple):
+        if len(item) == 2:
+            return item
+        (item,) = item
+    return _NO_KEY, item
+
+
+def _slugify_stream(slugifier: Slugifier, iterable: Iterable[Any]) -> Iterator[Any]:
+    for item in iterable:
+        key, text = _split_item(item)
+        yield slugifier(text) if key is _NO_KEY else (key, slugifier(text))
+
+
+def slugify_many(iterable: Iterable[str | tuple[Any, str]], **options: Any) -> Iterator[str | tuple[Any, str]]:
+    """
+    Lazily slugify every item of an iterable.
+    Options are prepared once and reused for the whole stream, and items are consumed one at a time,
+    so lists, file objects and database cursors are all processed in constant memory.
+    :param iterable (iterable): texts, or (key, text) pairs which are yielded back as (key, slug),
+        single column rows are read as their text
+    :param options: any keyword argument accepted by `slugify()`
+    :return (iterator): slugs in input order
+    """
+    return _slugify_stream(Slugifier(**options), iterable)
+
+
+def _init_worker(slugifier: Slugifier) -> None:
+    global _worker_slugifier
+    _worker_slugifier = slugifier
+
+
+def _slugify_chunk(chunk: list[Any]) -> list[Any]:
+    assert _worker_slugifier is not None
+    return list(_slugify_stream(_worker_slugifier, chunk))
+
+
+def _parallel_stream(slugifier: Slugifier, iterable: Iterable[Any], workers: int, chunksize: int) -> Iterator[Any]:
+    # pulls in multiprocessing, about 20 ms of import time which only parallel runs pay
+    from concurrent.futures import ProcessPoolExecutor
+
+    iterator = iter(iterable)
+    pending: deque[Future[list[Any]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(slugifier,)) as executor:
+        while True:
+            chunk = list(itertools.islice(iterator, chunksize))
+            if chunk:
+                pending.append(executor.submit(_slugify_chunk, chunk))
+            # keep a bounded number of chunks in flight so large inputs are not loaded at once
+            while pending and (len(pending) >= 2 * workers or not chunk):
+                yield from pending.popleft().result()
+            if not chunk:
+                break
+
+
+def slugify_parallel(
+    iterable: Iterable[str | tuple[Any, str]],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    **options: Any,
+) -> Iterator[str | tuple[Any, str]]:
+    """
+    Slugify every item of an iterable using a pool of worker processes.
+    Options are prepared once and sent to each worker when it starts, items are sent in chunks
+    and results are yielded lazily in input order.
+    :param iterable (iterable): texts, or (key, text) pairs which are yielded back as (key, slug),
+        single column rows are read as their text
+    :param workers (int): number of worker processes, defaults to the number of CPUs
+    :param chunksize (int): number of items sent to a worker at once
+    :param options: any keyword argument accepted by `slugify()`
+    :return (iterator): slugs in input order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    return _parallel_stream(Slugifier(**options), iterable, workers, chunksize)
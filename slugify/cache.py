@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from .batch import _NO_KEY, _split_item
+from .options import SlugifyOptions
+from .slugify import Slugifier, slugify
+
+__all__ = ['SlugCache', 'SQLiteSlugCache', 'CacheInfo']
+
+# texts looked up or stored per SQL statement, within the default SQLite limit of bound parameters
+SQLITE_BATCH_SIZE = 500
+DEFAULT_BATCH_SIZE = 10000
+
+_DEFAULT_OPTIONS = SlugifyOptions()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _canonical(options: dict[str, Any]) -> SlugifyOptions:
+    """ Canonical form of a set of slugify options, calls without options skip building it """
+    return SlugifyOptions(**options) if options else _DEFAULT_OPTIONS
+
+
+class SlugCache:
+    """
+    Bounded, thread-safe LRU cache of slugify results.
+
+    Results are keyed on the input text plus the full set of options.  Once `maxsize` entries
+    are stored, the least recently used one is evicted.  Texts longer than `max_text_length`
+    characters are slugified without being stored, so large inputs cannot inflate the cache.
+
+    >>> cache = SlugCache(maxsize=10000)
+    >>> cache.slugify('Hello World', max_length=5)
+    'hello'
+    """
+
+    def __init__(self, maxsize: int = 1024, max_text_length: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.max_text_length = max_text_length
+        self._data: OrderedDict[tuple[str, SlugifyOptions], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def slugify(self, text: str, **options: Any) -> str:
+        """
+        Make a slug from the given text, reusing a previous result when available.
+        :param text (str): initial text
+        :param options: any keyword argument accepted by `slugify()`
+        :return (str):
+        """
+        canonical = _canonical(options)
+
+        if not isinstance(text, str) or len(text) > self.max_text_length:
+            with self._lock:
+                self._misses += 1
+            return slugify(text, **canonical._asdict())
+
+        key = (text, canonical)
+        with self._lock:
+            try:
+                result = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return result
+
+        result = slugify(text, **canonical._asdict())
+
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def info(self) -> CacheInfo:
+        """ Report cache statistics """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """ Remove all entries and reset statistics """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SQLiteSlugCache:
+    """
+    Persistent cache of slugify results in a SQLite database file.
+
+    Results are keyed on the input text plus the `SlugifyOptions.digest` of the options, which covers
+    the library version and the transliteration backend, so an upgrade or a different backend never
+    reuses stale slugs.  A `transliterator` option must be a module level function, a
+    `functools.partial` of one or a `TableTransliterator`, see `SlugifyOptions.digest`.
+    The database is in write-ahead logging mode: any number of processes can read from it while one
+    of them writes.  Once `maxsize` entries are stored, the oldest ones are evicted.  Texts longer
+    than `max_text_length` characters are slugified without being stored.
+
+    Each process should open its own cache, connections are not shared across processes.
+
+    >>> cache = SQLiteSlugCache('slugs.sqlite3', maxsize=50_000_000)
+    >>> list(cache.slugify_many(['Hello World', 'Crème brûlée'], max_length=20))
+    ['hello-world', 'creme-brulee']
+
+    :param database (str): path of the database file, or ':memory:'
+    :param maxsize (int): maximum number of entries
+    :param max_text_length (int): longest text stored
+    :param timeout (float): seconds to wait for a lock held by another process
+    """
+
+    def __init__(
+        self,
+        database: str = ':memory:',
+        maxsize: int = 10_000_000,
+        max_text_length: int = 1024,
+        timeout: float = 30.0,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        # sqlite3 takes several milliseconds to import, so only SQLite backed caches load it
+        import sqlite3
+
+        self.database = database
+        self.maxsize = maxsize
+        self.max_text_length = max_text_length
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            database, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS slug_options (id INTEGER PRIMARY KEY, fingerprint TEXT UNIQUE NOT NULL)')
+        # entries are evicted in rowid order, which is their insertion order
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS slug_cache ('
+            'options INTEGER NOT NULL, text TEXT NOT NULL, slug TEXT NOT NULL, UNIQUE (options, text))')
+        self._option_ids: dict[SlugifyOptions, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _options_id(self, options: SlugifyOptions) -> int:
+        """ Row id of a set of options in the database, shared by every process using the same options """
+        try:
+            return self._option_ids[options]
+        except KeyError:
+            pass
+        fingerprint = options.digest
+        with self._lock:
+            self._connection.execute('INSERT OR IGNORE INTO slug_options (fingerprint) VALUES (?)', (fingerprint,))
+            row = self._connection.execute('SELECT id FROM slug_options WHERE fingerprint = ?', (fingerprint,)).fetchone()
+        self._option_ids[options] = options_id = int(row[0])
+        return options_id
+
+    def _get(self, options_id: int, texts: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(texts), SQLITE_BATCH_SIZE):
+                chunk = texts[start:start + SQLITE_BATCH_SIZE]
+                found.update(self._connection.execute(
+                    'SELECT text, slug FROM slug_cache WHERE options = ? AND text IN ({})'.format(
+                        ', '.join('?' * len(chunk))),
+                    (options_id, *chunk)))
+        return found
+
+    def _put(self, options_id: int, slugs: dict[str, str]) -> None:
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO slug_cache (options, text, slug) VALUES (?, ?, ?)',
+                    ((options_id, text, slug) for text, slug in slugs.items()))
+                # keep the entries with the `maxsize` newest row ids
+                cursor = self._connection.execute(
+                    'DELETE FROM slug_cache WHERE rowid <= (SELECT max(rowid) FROM slug_cache) - ?', (self.maxsize,))
+                self._connection.execute('COMMIT')
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._evictions += max(cursor.rowcount, 0)
+
+    def get_many(self, texts: Iterable[str], **options: Any) -> dict[str, str]:
+        """
+        Look up the cached slugs of many texts at once.
+        :param texts (iterable): texts to look up
+        :param options: any keyword argument accepted by `slugify()`
+        :return (dict): slugs of the texts found in the cache, by text
+        """
+        return self._get(self._options_id(_canonical(options)), list(dict.fromkeys(texts)))
+
+    def put_many(self, slugs: dict[str, str], **options: Any) -> None:
+        """
+        Store the slugs of many texts in a single transaction.
+        :param slugs (dict): slugs by text, made with the given options
+        :param options: any keyword argument accepted by `slugify()`
+        """
+        if slugs:
+            self._put(self._options_id(_canonical(options)), slugs)
+
+    def _slugify_batch(self, slugifier: Slugifier, options_id: int, texts: list[Any]) -> list[str]:
+        cacheable = [text for text in texts if isinstance(text, str) and len(text) <= self.max_text_length]
+        slugs = self._get(options_id, list(dict.fromkeys(cacheable)))
+        hits = sum(text in slugs for text in cacheable)
+        new = {text: slugifier(text) for text in cacheable if text not in slugs}
+        if new:
+            self._put(options_id, new)
+            slugs.update(new)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(texts) - hits
+        return [slugs[text] if text in slugs else slugifier(text) for text in texts]
+
+    def slugify(self, text: str, **options: Any) -> str:
+        """
+        Make a slug from the given text, reusing a previous result when available.
+        :param text (str): initial text
+        :param options: any keyword argument accepted by `slugify()`
+        :return (str):
+        """
+        canonical = _canonical(options)
+        return self._slugify_batch(Slugifier(**canonical._asdict()), self._options_id(canonical), [text])[0]
+
+    def slugify_many(
+        self,
+        iterable: Iterable[str | tuple[Any, str]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **options: Any,
+    ) -> Iterator[str | tuple[Any, str]]:
+        """
+        Lazily slugify every item of an iterable, looking up and storing slugs one batch at a time.
+        :param iterable (iterable): texts, or (key, text) pairs which are yielded back as (key, slug),
+            single column rows are read as their text
+        :param batch_size (int): items read, looked up and stored at once
+        :param options: any keyword argument accepted by `slugify()`
+        :return (iterator): slugs in input order
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        canonical = _canonical(options)
+        return self._slugify_stream(
+            Slugifier(**canonical._asdict()), self._options_id(canonical), iter(iterable), batch_size)
+
+    def _slugify_stream(
+        self,
+        slugifier: Slugifier,
+        options_id: int,
+        iterator: Iterator[Any],
+        batch_size: int,
+    ) -> Iterator[Any]:
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            keys, texts = zip(*map(_split_item, batch))
+            for key, slug in zip(keys, self._slugify_batch(slugifier, options_id, list(texts))):
+                yield slug if key is _NO_KEY else (key, slug)
+
+    def info(self) -> CacheInfo:
+        """ Report cache statistics, hits, misses and evictions are those of this instance """
+        return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self))
+
+    def clear(self) -> None:
+        """ Remove all entries, for every set of options, and reset statistics """
+        with self._lock:
+            self._connection.execute('DELETE FROM slug_cache')
+            self._hits = self._misses = self._evictions = 0
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute('SELECT count(*) FROM slug_cache').fetchone()[0])
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Callable, Iterable
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from .__version__ import __version__
+from .slugify import DEFAULT_SEPARATOR
+from .transliteration import TableTransliterator, default_transliterator
+
+__all__ = ['SlugifyOptions']
+
+
+def _callable_name(value: Any) -> tuple[str | None, str]:
+    """ Module and qualified name of a callable, which identify it in every process """
+    name = getattr(value, '__qualname__', None)
+    owner = getattr(value, '__self__', None)
+    # lambdas, local functions, bound methods and other callable objects have no such name
+    if name is None or '<' in name or (owner is not None and not isinstance(owner, ModuleType)):
+        raise TypeError("{!r} has no stable identity, use a module level function or a functools.partial "
+                        "of one".format(value))
+    return getattr(value, '__module__', None), name
+
+
+def _stable(value: Any) -> Any:
+    """ Form of an option value whose repr is the same in every process """
+    if isinstance(value, re.Pattern):
+        return ('re', value.pattern, value.flags)
+    if isinstance(value, tuple):
+        return tuple(_stable(item) for item in value)
+    if isinstance(value, TableTransliterator):
+        return ('TableTransliterator', _stable(value.backend))
+    if isinstance(value, functools.partial):
+        return ('partial', _stable(value.func), _stable(value.args), _stable(tuple(sorted(value.keywords.items()))))
+    if callable(value):
+        return ('callable',) + _callable_name(value)
+    return value
+
+
+class _Options(NamedTuple):
+    entities: bool = True
+    decimal: bool = True
+    hexadecimal: bool = True
+    max_length: int = 0
+    word_boundary: bool = False
+    separator: str = DEFAULT_SEPARATOR
+    save_order: bool = False
+    stopwords: tuple[str, ...] = ()
+    regex_pattern: re.Pattern[str] | None = None
+    lowercase: bool = True
+    replacements: tuple[tuple[str, str], ...] = ()
+    allow_unicode: bool = False
+    pre_translations: tuple[str, ...] = ()
+    transliterator: Callable[[str], str] | None = None
+
+
+class SlugifyOptions(_Options):
+    """
+    Canonical, immutable set of slugify options.
+
+    Options which slugify the same way are equal and hash alike: stopwords are sorted (and
+    lowercased unless `lowercase` is off), iterables become tuples and `regex_pattern` is compiled.
+    Instances can be pickled and used as dictionary keys.  `digest` is a stable key for the
+    options, the library version and the transliteration backend, the same in every process,
+    e.g. to key persistent caches or to shard work.
+
+    >>> options = SlugifyOptions(max_length=20, stopwords=['The', 'a'])
+    >>> options == SlugifyOptions(stopwords=('a', 'the'), max_length=20)
+    True
+    >>> slugify('The quick brown fox', **options._asdict())
+    'quick-brown-fox'
+
+    Options are the same as for :func:`slugify`.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        entities: bool = True,
+        decimal: bool = True,
+        hexadecimal: bool = True,
+        max_length: int = 0,
+        word_boundary: bool = False,
+        separator: str = DEFAULT_SEPARATOR,
+        save_order: bool = False,
+        stopwords: Iterable[str] = (),
+        regex_pattern: re.Pattern[str] | str | None = None,
+        lowercase: bool = True,
+        replacements: Iterable[Iterable[str]] = (),
+        allow_unicode: bool = False,
+        pre_translations: str | Iterable[str] = (),
+        transliterator: Callable[[str], str] | None = None,
+    ) -> SlugifyOptions:
+        # empty iterables are the common case, and are not copied word by word
+        words: tuple[str, ...] = ()
+        if stopwords:
+            words = tuple(sorted({word.lower() for word in stopwords} if lowercase else set(stopwords)))
+        rules: tuple[tuple[str, str], ...] = ()
+        if replacements:
+            rules = tuple((old, new) for old, new in replacements)
+        if isinstance(pre_translations, str):
+            pre_translations = (pre_translations,)
+        return super().__new__(
+            cls,
+            bool(entities),
+            bool(decimal),
+            bool(hexadecimal),
+            int(max_length),
+            bool(word_boundary),
+            separator,
+            bool(save_order),
+            words,
+            re.compile(regex_pattern) if regex_pattern else None,
+            bool(lowercase),
+            rules,
+            bool(allow_unicode),
+            tuple(pre_translations),
+            transliterator,
+        )
+
+    @property
+    def digest(self) -> str:
+        """
+        Hexadecimal digest of the options, the library version and the transliteration backend.
+        A `transliterator` must be a module level function, a `functools.partial` of one or a
+        `TableTransliterator`, other callables raise TypeError as they cannot be told apart.
+        """
+        # hashlib would add about 4 ms to the package import
+        import hashlib
+
+        backend = default_transliterator().__module__
+        description = repr((__version__, backend, _stable(tuple(self._asdict().items()))))
+        return hashlib.sha256(description.encode('utf-8')).hexdigest()[:32]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+__all__ = ['MultiReplacer']
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    """ Build a regex from a character trie; at each node longer matches are tried first """
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:{})'.format('|'.join(branches))
+    if '' in node:
+        # a rule ends here: the greedy optional group prefers the longer rules below this node
+        body = '(?:{})?'.format(body)
+    return body
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """ True if a proper suffix of `first` is a prefix of `second` """
+    return any(first.endswith(second[:size]) for size in range(1, min(len(first), len(second))))
+
+
+def _sequential_equivalent(rules: tuple[tuple[str, str], ...]) -> bool:
+    """
+    Whether applying the rules one after the other with `str.replace` gives the same result as a
+    single leftmost-longest scan, for any text.
+    """
+    for index, (old, new) in enumerate(rules):
+        for later_old, _ in rules[index + 1:]:
+            # a later rule must not match text produced or joined by an earlier one
+            if new:
+                if later_old in new or new in later_old or _overlaps(new, later_old) or _overlaps(later_old, new):
+                    return False
+            elif len(later_old) > 1:
+                return False
+            if later_old == old:
+                continue
+            # an earlier rule may contain a later one, but must not be shadowed by it or overlap it
+            if old in later_old or _overlaps(old, later_old) or _overlaps(later_old, old):
+                return False
+    return True
+
+
+class MultiReplacer:
+    """
+    Apply many replacement rules in a single scan of the text.
+
+    The rules are compiled once: originals longer than one character are matched in a single scan by
+    one trie-shaped regex, so the cost no longer grows with the number of rules, and single characters
+    are swapped afterwards.  When rules overlap, the match starting leftmost wins, then the longest
+    one, then the first one in rule order.
+
+    >>> replace = MultiReplacer([['|', 'or'], ['%', 'percent'], ['&&', 'and']])
+    >>> replace('10 | 20 % && more')
+    '10 or 20 percent and more'
+    """
+
+    def __init__(self, rules: Iterable[Iterable[str]]) -> None:
+        self.rules = tuple((old, new) for old, new in rules)
+        self.mapping: dict[str, str] = {}
+        for old, new in self.rules:
+            if not old:
+                raise ValueError("Replacement rules must not have an empty original")
+            self.mapping.setdefault(old, new)
+
+        # same result as a `str.replace` loop over the rules, which is what `slugify()` promises
+        self.sequential_equivalent = _sequential_equivalent(self.rules)
+
+        # longer originals are matched by one trie-shaped regex, single characters afterwards by
+        # C-level passes; the regex takes everything when its output could be touched by those passes
+        single = {old: new for old, new in self.mapping.items() if len(old) == 1}
+        multi = [old for old in self.mapping if len(old) > 1]
+        if any(char in single for old in multi for char in self.mapping[old]):
+            single, multi = {}, list(self.mapping)
+
+        self._pattern: re.Pattern[str] | None = None
+        if multi:
+            trie: dict[str, Any] = {}
+            for old in multi:
+                node = trie
+                for char in old:
+                    node = node.setdefault(char, {})
+                node[''] = {}
+            self._pattern = re.compile(_trie_pattern(trie))
+
+        # `str.replace` per character is fastest, but a table is needed when replacements chain
+        self._singles = tuple(single.items())
+        self._table: dict[int, str] | None = None
+        if any(char in single for new in single.values() for char in new):
+            self._table = str.maketrans(single)
+
+    def _replace_match(self, match: re.Match[str]) -> str:
+        return self.mapping[match.group()]
+
+    def __call__(self, text: str) -> str:
+        if self._pattern is not None:
+            text = self._pattern.sub(self._replace_match, text)
+        if self._table is not None:
+            return text.translate(self._table)
+        for old, new in self._singles:
+            text = text.replace(old, new)
+        return text
@@ -1,19 +1,43 @@
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
-from collections.abc import Iterable
-from html.entities import name2codepoint
+from collections.abc import Callable, Iterable
+from typing import Any
 
-try:
-    import unidecode
-except ImportError:
-    import text_unidecode as unidecode  # type: ignore[import-untyped, no-redef]
+from .replacements import MultiReplacer
+from .special import pre_translator
+from .timing import _active_timings
+from .transliteration import _load_unidecode, default_transliterator
 
-__all__ = ['slugify', 'smart_truncate']
+__all__ = ['slugify', 'smart_truncate', 'Slugifier', 'is_slug']
 
 
-CHAR_ENTITY_PATTERN = re.compile(r'&(%s);' % '|'.join(name2codepoint))
+# The transliteration backend and the named entity table are costly to load, so they are
+# only loaded on first use.  `unidecode` and `CHAR_ENTITY_PATTERN` are still module attributes.
+
+@functools.lru_cache(maxsize=None)
+def _load_name2codepoint() -> dict[str, int]:
+    from html.entities import name2codepoint
+    return name2codepoint
+
+
+@functools.lru_cache(maxsize=None)
+def _load_char_entity_pattern() -> re.Pattern[str]:
+    return re.compile(r'&(%s);' % '|'.join(_load_name2codepoint()))
+
+
+def __getattr__(name: str) -> object:
+    if name == 'unidecode':
+        return _load_unidecode()
+    if name == 'CHAR_ENTITY_PATTERN':
+        return _load_char_entity_pattern()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+CHARACTER_REFERENCE_PATTERN = re.compile(r'&(?:#(\d+)|#x([\da-fA-F]+)|([a-zA-Z][a-zA-Z0-9]*));')
+# superseded by CHARACTER_REFERENCE_PATTERN, kept for backwards compatibility
 DECIMAL_PATTERN = re.compile(r'&#(\d+);')
 HEX_PATTERN = re.compile(r'&#x([\da-fA-F]+);')
 QUOTE_PATTERN = re.compile(r'[\']+')
@@ -23,6 +47,100 @@ DUPLICATE_DASH_PATTERN = re.compile(r'-{2,}')
 NUMBERS_PATTERN = re.compile(r'(?<=\d),(?=\d)')
 DEFAULT_SEPARATOR = '-'
 
+CLEANUP_TABLE_MAX_SIZE = 65536
+
+# with `max_length` set, texts longer than this are slugified in growing prefixes cut at whitespace or dashes
+PREFIX_MIN_LENGTH = 4096
+PREFIX_CUT_PATTERN = re.compile(r'[- \t\n\r]')
+
+# separator characters which no stage before the cleanup touches, and which the cleanup turns into spaces
+SLUG_SEPARATOR_EXCLUDED_CHARS = "&',"
+
+
+# rule lists whose compiled replacer is kept, `slugify()` builds a `Slugifier` on every call
+REPLACER_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=REPLACER_CACHE_SIZE)
+def _compiled_replacer(rules: tuple[tuple[str, str], ...]) -> MultiReplacer | None:
+    """ Single scan replacer of the rules, None when it could differ from the `str.replace` loop """
+    if not all(old for old, _ in rules):
+        return None
+    replacer = MultiReplacer(rules)
+    return replacer if replacer.sequential_equivalent else None
+
+
+@functools.lru_cache(maxsize=256)
+def _slug_pattern(word: str, separator: str) -> re.Pattern[str]:
+    """ Pattern of the slugs made of `word` matches joined by the separator, including the empty slug """
+    return re.compile('(?:{0}(?:{1}{0})*)?'.format(word, re.escape(separator)))
+
+
+class _CleanupTable(dict[int, str]):
+    """
+    `str.translate` table of the single scan cleanup.
+    Allowed characters are kept, quotes are dropped and any other character becomes a space.
+    Ascii letters and digits are allowed, other letters and digits only with `allow_unicode`,
+    the same characters as `DISALLOWED_CHARS_PATTERN` and `DISALLOWED_UNICODE_CHARS_PATTERN` allow.
+    Non-ascii characters are looked up on first use and remembered, up to CLEANUP_TABLE_MAX_SIZE.
+    """
+
+    def __init__(self, allow_unicode: bool, lowercase: bool = False) -> None:
+        super().__init__()
+        self.allow_unicode = allow_unicode
+        for codepoint in range(128):
+            char = chr(codepoint)
+            if char.isalnum():
+                self[codepoint] = char.lower() if lowercase else char
+            else:
+                self[codepoint] = ' '
+        self[ord("'")] = ''
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        result = char if self.allow_unicode and char.isalnum() else ' '
+        if len(self) < CLEANUP_TABLE_MAX_SIZE:
+            self[codepoint] = result
+        return result
+
+
+_ASCII_CLEANUP_TABLE = _CleanupTable(allow_unicode=False)
+_LOWERCASE_ASCII_CLEANUP_TABLE = _CleanupTable(allow_unicode=False, lowercase=True)
+_UNICODE_CLEANUP_TABLE = _CleanupTable(allow_unicode=True)
+
+
+def _fit_words(string: str, max_length: int, separator: str, save_order: bool) -> tuple[list[str], bool]:
+    """
+    Pick the words of a string which fit in `max_length` characters, the way `smart_truncate` does.
+    Words are found one at a time and the scan ends as soon as no further word can fit.
+    :return (tuple): the words, and whether words following the string would be ignored
+    """
+    if not separator:
+        # as str.split() would, an empty separator never advances the scan
+        raise ValueError("empty separator")
+    words: list[str] = []
+    length = 0
+    start = 0
+    end_of_string = len(string)
+    while length < max_length:
+        end = string.find(separator, start)
+        if end == -1:
+            end = end_of_string
+        if end > start:
+            next_len = length + end - start
+            if next_len < max_length:
+                words.append(string[start:end])
+                length = next_len + len(separator)
+            elif next_len == max_length:
+                words.append(string[start:end])
+                return words, True
+            elif save_order:
+                return words, True
+        if end == end_of_string:
+            break
+        start = end + len(separator)
+    return words, length >= max_length
+
 
 def smart_truncate(
     string: str,
@@ -55,21 +173,389 @@ def smart_truncate(
     if separator not in string:
         return string[:max_length]
 
-    truncated = ''
-    for word in string.split(separator):
-        if word:
-            next_len = len(truncated) + len(word)
-            if next_len < max_length:
-                truncated += '{}{}'.format(word, separator)
-            elif next_len == max_length:
-                truncated += '{}'.format(word)
+    words, _ = _fit_words(string, max_length, separator, save_order)
+    if not words:
+        return string[:max_length].strip(separator)
+    return separator.join(words).strip(separator)
+
+
+class Slugifier:
+    """
+    Reusable slugify configuration.
+
+    All options are validated and prepared once: the disallowed characters pattern is compiled,
+    stopwords are frozen into a set and replacement rules are materialized.  Calling the instance
+    slugifies a single string with the stored options.
+
+    >>> to_slug = Slugifier(max_length=20, stopwords=['the'])
+    >>> to_slug('The quick brown fox')
+    'quick-brown-fox'
+
+    Options are the same as for :func:`slugify`.
+    """
+
+    def __init__(
+        self,
+        entities: bool = True,
+        decimal: bool = True,
+        hexadecimal: bool = True,
+        max_length: int = 0,
+        word_boundary: bool = False,
+        separator: str = DEFAULT_SEPARATOR,
+        save_order: bool = False,
+        stopwords: Iterable[str] = (),
+        regex_pattern: re.Pattern[str] | str | None = None,
+        lowercase: bool = True,
+        replacements: Iterable[Iterable[str]] = (),
+        allow_unicode: bool = False,
+        pre_translations: str | Iterable[str] = (),
+        transliterator: Callable[[str], str] | None = None,
+    ) -> None:
+        self.entities = entities
+        self.decimal = decimal
+        self.hexadecimal = hexadecimal
+        self.max_length = max_length
+        self.word_boundary = word_boundary
+        self.separator = separator
+        self.save_order = save_order
+        self.lowercase = lowercase
+        self.allow_unicode = allow_unicode
+        self.transliterator = transliterator
+
+        self.stopwords: frozenset[str] = frozenset()
+        if stopwords:
+            if lowercase:
+                self.stopwords = frozenset(s.lower() for s in stopwords)
+            else:
+                self.stopwords = frozenset(stopwords)
+
+        self.replacements: tuple[tuple[str, str], ...] = ()
+        self._replacer: MultiReplacer | None = None
+        if replacements:
+            self.replacements = tuple((old, new) for old, new in replacements)
+            self._replacer = _compiled_replacer(self.replacements)
+
+        if isinstance(pre_translations, str):
+            pre_translations = (pre_translations,)
+        self.pre_translations = tuple(pre_translations)
+        self._pre_translator: MultiReplacer | None = None
+        self._pre_translate_ascii = False
+        if self.pre_translations:
+            self._pre_translator = pre_translator(*self.pre_translations)
+            # language tables usually only hold non-ascii chars, which ascii text can skip
+            self._pre_translate_ascii = any(old.isascii() for old, _ in self._pre_translator.rules)
+
+        # the default patterns are applied by the single scan cleanup, custom ones by regex
+        self._cleanup_table: _CleanupTable | None = None
+        if regex_pattern:
+            self.regex_pattern = re.compile(regex_pattern)
+        else:
+            self.regex_pattern = DISALLOWED_UNICODE_CHARS_PATTERN if allow_unicode else DISALLOWED_CHARS_PATTERN
+            self._cleanup_table = _UNICODE_CLEANUP_TABLE if allow_unicode else _ASCII_CLEANUP_TABLE
+            self._ascii_cleanup_table = _LOWERCASE_ASCII_CLEANUP_TABLE if lowercase else _ASCII_CLEANUP_TABLE
+
+        # Every stage but truncation then maps text cut at ascii whitespace or dashes piece by piece, so the
+        # slug of a prefix is a prefix of the full slug ending at a word boundary.  Long texts are
+        # only processed up to where truncation can no longer be changed by the rest of the text.
+        self._prefix_min_length: int | None = None
+        if max_length > 0 and not self.replacements and not regex_pattern and transliterator is None:
+            if self._pre_translator is None or not any(
+                    PREFIX_CUT_PATTERN.search(old) for old, _ in self._pre_translator.rules):
+                self._prefix_min_length = max(PREFIX_MIN_LENGTH, 8 * max_length)
+        self._untruncated: Slugifier | None = None
+
+        # With the default cleanup, a slug is words of allowed characters joined by the separator, which
+        # can be matched in one scan.  The separator has to be split on by the cleanup like any
+        # disallowed character, without being changed by an earlier stage.
+        self._slug_pattern: re.Pattern[str] | None = None
+        # (an empty separator would make the pattern a nested quantifier, which backtracks exponentially)
+        split_separator = bool(separator) and all(
+            c.isascii() and not c.isalnum() and c not in SLUG_SEPARATOR_EXCLUDED_CHARS for c in separator)
+        if split_separator and not regex_pattern and not self._pre_translate_ascii:
+            if allow_unicode:
+                word = r'[^\W_A-Z]+' if lowercase else r'[^\W_]+'
+            else:
+                word = r'[a-z0-9]+' if lowercase else r'[a-zA-Z0-9]+'
+            self._slug_pattern = _slug_pattern(word, separator)
+
+    def _replace(self, text: str) -> str:
+        if self._replacer is not None:
+            return self._replacer(text)
+        for old, new in self.replacements:
+            text = text.replace(old, new)
+        return text
+
+    def _decode_reference(self, match: re.Match[str]) -> str:
+        decimal, hexadecimal, name = match.groups()
+        try:
+            if decimal is not None:
+                if self.decimal:
+                    return chr(int(decimal))
+            elif hexadecimal is not None:
+                if self.hexadecimal:
+                    return chr(int(hexadecimal, 16))
+            elif self.entities:
+                return chr(_load_name2codepoint()[name])
+        except (KeyError, ValueError, OverflowError):
+            # unknown entity or invalid code point, keep this reference as is
+            pass
+        return match.group()
+
+    def _truncation_complete(self, slug: str) -> bool:
+        """ Whether more words after this untruncated slug could not change its truncation """
+        if len(slug) < self.max_length:
+            return False
+        if not self.word_boundary:
+            return True
+        return _fit_words(slug, self.max_length, DEFAULT_SEPARATOR, self.save_order)[1]
+
+    def _slugify_prefixes(self, text: str, lap: Callable[[str], None] | None) -> str:
+        """
+        Slugify growing prefixes of a long text until its truncated slug is known.
+        The stages of every prefix are timed as part of this one call.
+        """
+        if not isinstance(text, str):
+            text = str(text, 'utf-8', 'ignore')
+        if self._untruncated is None:
+            # copy pulls in weakref, about 1 ms of import time only this path needs
+            import copy
+            self._untruncated = copy.copy(self)
+            self._untruncated.max_length = 0
+            self._untruncated.separator = DEFAULT_SEPARATOR
+            self._untruncated._prefix_min_length = None
+            self._untruncated._slug_pattern = None
+        size = 4 * self.max_length
+        while True:
+            match = PREFIX_CUT_PATTERN.search(text, size) if size < len(text) else None
+            if match is None:
+                slug = self._untruncated._slugify(text, lap)
                 break
+            slug = self._untruncated._slugify(text[:match.start()], lap)
+            if self._truncation_complete(slug):
+                break
+            size = 2 * match.end()
+
+        text = smart_truncate(slug, self.max_length, self.word_boundary, DEFAULT_SEPARATOR, self.save_order)
+        if lap is not None:
+            lap('truncate')
+        if self.separator != DEFAULT_SEPARATOR:
+            text = text.replace(DEFAULT_SEPARATOR, self.separator)
+            if lap is not None:
+                lap('separator')
+        return text
+
+    def _known_slug(self, text: str) -> bool | None:
+        """ Whether the text slugifies to itself, None when that cannot be told without slugifying it """
+        if self._slug_pattern is None or not isinstance(text, str):
+            return None
+        # with replacements, only a text they leave alone is known either way
+        unknown = None if self.replacements else False
+        if self._slug_pattern.fullmatch(text) is None:
+            return unknown
+
+        if not text.isascii():
+            # only matched with allow_unicode: the text must be left as it is by normalization and lowercasing
+            if self._pre_translator is not None:
+                return None
+            if not unicodedata.is_normalized('NFKC', text) or (self.lowercase and text.lower() != text):
+                return None
+
+        separator = self.separator
+        if self.stopwords or self.replacements:
+            words = text.split(separator)
+            if self.stopwords and not self.stopwords.isdisjoint(words):
+                return unknown
+            if self.replacements:
+                dashed = DEFAULT_SEPARATOR.join(words)
+                if any(old in text or old in dashed for old, _ in self.replacements):
+                    return None
+
+        # truncation applies to the slug with the default separator
+        if self.max_length > 0:
+            length = len(text)
+            if len(separator) > 1:
+                length -= (len(separator) - 1) * text.count(separator)
+            if length > self.max_length:
+                return unknown
+        return True
+
+    def is_slug(self, text: str) -> bool:
+        """
+        Tell whether slugifying the text gives it back unchanged.
+        Usually decided by a single scan of the text, the text is only slugified when it cannot be.
+        :param text (str): text to check
+        :return (bool):
+        """
+        known = self._known_slug(text)
+        if known is not None:
+            return known
+        return isinstance(text, str) and self(text) == text
+
+    def __call__(self, text: str) -> str:
+        """
+        Make a slug from the given text.
+        :param text (str): initial text
+        :return (str):
+        """
+
+        # per-stage timing, only when a `StageTimings` collector is active
+        timings = _active_timings.get()
+        lap = timings.start() if timings is not None else None
+
+        # long text with a short max_length, only process as much of it as needed
+        if self._prefix_min_length is not None and len(text) > self._prefix_min_length:
+            return self._slugify_prefixes(text, lap)
+        return self._slugify(text, lap)
+
+    def _slugify(self, text: str, lap: Callable[[str], None] | None) -> str:
+        """ Run the slugify stages, `lap` is called at the end of each stage when the call is timed """
+
+        # already a slug
+        if self._slug_pattern is not None and self._known_slug(text):
+            if lap is not None:
+                lap('is_slug')
+            return text
+
+        # user-specific replacements
+        if self.replacements:
+            text = self._replace(text)
+            if lap is not None:
+                lap('replacements')
+
+        # ensure text is unicode
+        if not isinstance(text, str):
+            text = str(text, 'utf-8', 'ignore')
+
+        # language specific pre translations
+        if self._pre_translator is not None and (self._pre_translate_ascii or not text.isascii()):
+            text = self._pre_translator(text)
+            if lap is not None:
+                lap('pre_translations')
+
+        # replace quotes with dashes - pre-process
+        if "'" in text:
+            text = QUOTE_PATTERN.sub(DEFAULT_SEPARATOR, text)
+            if lap is not None:
+                lap('quotes')
+
+        # normalize text, convert to unicode if required
+        # (ascii text is already normalized and needs no transliteration)
+        # (`unicodedata.normalize()` returns text which passes its quick check as it is, without a copy)
+        # `normalized` tells whether the text is still known to be in normal form, the second
+        # normalization is only needed once a later stage may have changed that
+        normalized = True
+        if text.isascii():
+            pass
+        elif self.allow_unicode:
+            text = unicodedata.normalize('NFKC', text)
+            if lap is not None:
+                lap('normalize')
+        else:
+            text = unicodedata.normalize('NFKD', text)
+            if lap is not None:
+                lap('normalize')
+            text = (self.transliterator or default_transliterator())(text)
+            normalized = False
+            if lap is not None:
+                lap('transliterate')
+
+        # ensure text is still in unicode
+        if not isinstance(text, str):
+            text = str(text, 'utf-8', 'ignore')
+
+        # character entity, decimal and hexadecimal references
+        if (self.entities or self.decimal or self.hexadecimal) and '&' in text:
+            text, decoded = CHARACTER_REFERENCE_PATTERN.subn(self._decode_reference, text)
+            if decoded:
+                normalized = False
+            if lap is not None:
+                lap('entities')
+
+        # re normalize text
+        if normalized or text.isascii():
+            pass
+        elif self.allow_unicode:
+            text = unicodedata.normalize('NFKC', text)
+            if lap is not None:
+                lap('renormalize')
+        else:
+            text = unicodedata.normalize('NFKD', text)
+            if lap is not None:
+                lap('renormalize')
+
+        if self._cleanup_table is not None:
+            # single scan cleanup: one `str.translate` drops quotes and turns every disallowed
+            # character into a space, ascii text is lowercased on the way; splitting on the
+            # spaces then collapses and trims the separators and gives the words
+            if text.isascii():
+                table = self._ascii_cleanup_table
             else:
-                if save_order:
-                    break
-    if not truncated:
-        truncated = string[:max_length]
-    return truncated.strip(separator)
+                if self.lowercase:
+                    text = text.lower()
+                    if lap is not None:
+                        lap('lowercase')
+                table = self._cleanup_table
+
+            # digit groups are joined after quotes are dropped, as in "1','000"
+            if ',' in text:
+                text = NUMBERS_PATTERN.sub('', text.replace("'", ''))
+
+            words = text.translate(table).split()
+            if lap is not None:
+                lap('cleanup')
+
+            # remove stopwords
+            if self.stopwords:
+                words = [w for w in words if w not in self.stopwords]
+                if lap is not None:
+                    lap('stopwords')
+            text = DEFAULT_SEPARATOR.join(words)
+        else:
+            # make the text lowercase (optional)
+            if self.lowercase:
+                text = text.lower()
+                if lap is not None:
+                    lap('lowercase')
+
+            # remove generated quotes -- post-process
+            text = QUOTE_PATTERN.sub('', text)
+
+            # cleanup numbers
+            text = NUMBERS_PATTERN.sub('', text)
+
+            # replace all other unwanted characters
+            text = self.regex_pattern.sub(DEFAULT_SEPARATOR, text)
+
+            # remove redundant
+            text = DUPLICATE_DASH_PATTERN.sub(DEFAULT_SEPARATOR, text).strip(DEFAULT_SEPARATOR)
+            if lap is not None:
+                lap('cleanup')
+
+            # remove stopwords
+            if self.stopwords:
+                words = [w for w in text.split(DEFAULT_SEPARATOR) if w not in self.stopwords]
+                text = DEFAULT_SEPARATOR.join(words)
+                if lap is not None:
+                    lap('stopwords')
+
+        # finalize user-specific replacements
+        if self.replacements:
+            text = self._replace(text)
+            if lap is not None:
+                lap('replacements')
+
+        # smart truncate if requested
+        if self.max_length > 0:
+            text = smart_truncate(text, self.max_length, self.word_boundary, DEFAULT_SEPARATOR, self.save_order)
+            if lap is not None:
+                lap('truncate')
+
+        if self.separator != DEFAULT_SEPARATOR:
+            text = text.replace(DEFAULT_SEPARATOR, self.separator)
+            if lap is not None:
+                lap('separator')
+
+        return text
 
 
 def slugify(
@@ -86,6 +572,8 @@ def slugify(
     lowercase: bool = True,
     replacements: Iterable[Iterable[str]] = (),
     allow_unicode: bool = False,
+    pre_translations: str | Iterable[str] = (),
+    transliterator: Callable[[str], str] | None = None,
 ) -> str:
     """
     Make a slug from the given text.
@@ -102,96 +590,35 @@ def slugify(
     :param lowercase (bool): activate case sensitivity by setting it to False
     :param replacements (iterable): list of replacement rules e.g. [['|', 'or'], ['%', 'percent']]
     :param allow_unicode (bool): allow unicode characters
+    :param pre_translations (iterable): language profiles applied before transliteration e.g. ['cyrillic', 'german']
+    :param transliterator (callable): transliteration backend for non-ascii text, `unidecode` by default
     :return (str):
     """
 
-    # user-specific replacements
-    if replacements:
-        for old, new in replacements:
-            text = text.replace(old, new)
-
-    # ensure text is unicode
-    if not isinstance(text, str):
-        text = str(text, 'utf-8', 'ignore')
-
-    # replace quotes with dashes - pre-process
-    text = QUOTE_PATTERN.sub(DEFAULT_SEPARATOR, text)
-
-    # normalize text, convert to unicode if required
-    if allow_unicode:
-        text = unicodedata.normalize('NFKC', text)
-    else:
-        text = unicodedata.normalize('NFKD', text)
-        text = unidecode.unidecode(text)
-
-    # ensure text is still in unicode
-    if not isinstance(text, str):
-        text = str(text, 'utf-8', 'ignore')
-
-    # character entity reference
-    if entities:
-        text = CHAR_ENTITY_PATTERN.sub(lambda m: chr(name2codepoint[m.group(1)]), text)
-
-    # decimal character reference
-    if decimal:
-        try:
-            text = DECIMAL_PATTERN.sub(lambda m: chr(int(m.group(1))), text)
-        except Exception:
-            pass
-
-    # hexadecimal character reference
-    if hexadecimal:
-        try:
-            text = HEX_PATTERN.sub(lambda m: chr(int(m.group(1), 16)), text)
-        except Exception:
-            pass
-
-    # re normalize text
-    if allow_unicode:
-        text = unicodedata.normalize('NFKC', text)
-    else:
-        text = unicodedata.normalize('NFKD', text)
-
-    # make the text lowercase (optional)
-    if lowercase:
-        text = text.lower()
-
-    # remove generated quotes -- post-process
-    text = QUOTE_PATTERN.sub('', text)
-
-    # cleanup numbers
-    text = NUMBERS_PATTERN.sub('', text)
-
-    # replace all other unwanted characters
-    if allow_unicode:
-        pattern = regex_pattern or DISALLOWED_UNICODE_CHARS_PATTERN
-    else:
-        pattern = regex_pattern or DISALLOWED_CHARS_PATTERN
-
-    text = re.sub(pattern, DEFAULT_SEPARATOR, text)
-
-    # remove redundant
-    text = DUPLICATE_DASH_PATTERN.sub(DEFAULT_SEPARATOR, text).strip(DEFAULT_SEPARATOR)
-
-    # remove stopwords
-    if stopwords:
-        if lowercase:
-            stopwords_lower = [s.lower() for s in stopwords]
-            words = [w for w in text.split(DEFAULT_SEPARATOR) if w not in stopwords_lower]
-        else:
-            words = [w for w in text.split(DEFAULT_SEPARATOR) if w not in stopwords]
-        text = DEFAULT_SEPARATOR.join(words)
-
-    # finalize user-specific replacements
-    if replacements:
-        for old, new in replacements:
-            text = text.replace(old, new)
-
-    # smart truncate if requested
-    if max_length > 0:
-        text = smart_truncate(text, max_length, word_boundary, DEFAULT_SEPARATOR, save_order)
-
-    if separator != DEFAULT_SEPARATOR:
-        text = text.replace(DEFAULT_SEPARATOR, separator)
-
-    return text
+    slugifier = Slugifier(
+        entities=entities,
+        decimal=decimal,
+        hexadecimal=hexadecimal,
+        max_length=max_length,
+        word_boundary=word_boundary,
+        separator=separator,
+        save_order=save_order,
+        stopwords=stopwords,
+        regex_pattern=regex_pattern,
+        lowercase=lowercase,
+        replacements=replacements,
+        allow_unicode=allow_unicode,
+        pre_translations=pre_translations,
+        transliterator=transliterator,
+    )
+    return slugifier(text)
+
+
+def is_slug(text: str, **options: Any) -> bool:
+    """
+    Tell whether the text is already a slug, that is `slugify(text, **options) == text`.
+    :param text (str): text to check
+    :param options: any keyword argument accepted by `slugify()`
+    :return (bool):
+    """
+    return Slugifier(**options).is_slug(text)
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterable
+
+from .replacements import MultiReplacer
+
+__all__ = [
+    'add_uppercase_char', 'CYRILLIC', 'GERMAN', 'GREEK', 'PRE_TRANSLATIONS',
+    'LANGUAGE_PROFILES', 'register_language', 'pre_translator',
+]
+
 
 def add_uppercase_char(char_list: list[tuple[str, str]]) -> list[tuple[str, str]]:
     """ Given a replacement char list, this adds uppercase chars to the list """
 
-    for item in char_list:
-        char, xlate = item
+    seen = set(char_list)
+    uppercase = []
+    for char, xlate in char_list:
         upper_dict = char.upper(), xlate.capitalize()
-        if upper_dict not in char_list and char != upper_dict[0]:
-            char_list.insert(0, upper_dict)
+        if upper_dict not in seen and char != upper_dict[0]:
+            seen.add(upper_dict)
+            uppercase.append(upper_dict)
+    # uppercase chars go first, the last one added at the very front
+    char_list[:0] = uppercase[::-1]
     return char_list
 
 
@@ -45,3 +59,29 @@ GREEK = add_uppercase_char(_GREEK)
 
 # Pre translations
 PRE_TRANSLATIONS = CYRILLIC + GERMAN + GREEK
+
+# Language profiles usable with the `pre_translations` option of slugify
+LANGUAGE_PROFILES: dict[str, list[tuple[str, str]]] = {
+    'cyrillic': CYRILLIC,
+    'german': GERMAN,
+    'greek': GREEK,
+}
+
+
+def register_language(name: str, char_list: Iterable[tuple[str, str]]) -> None:
+    """ Register a language profile, uppercase chars are added to the given char list """
+    LANGUAGE_PROFILES[name] = add_uppercase_char(list(char_list))
+    pre_translator.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def pre_translator(*languages: str) -> MultiReplacer:
+    """ Given language profile names, this compiles their char lists into one replacer, once """
+
+    char_list: list[tuple[str, str]] = []
+    for language in languages:
+        if language not in LANGUAGE_PROFILES:
+            raise ValueError("Unknown language {!r}, expected one of: {}".format(
+                language, ', '.join(sorted(LANGUAGE_PROFILES))))
+        char_list.extend(LANGUAGE_PROFILES[language])
+    return MultiReplacer(char_list)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from types import TracebackType
+
+__all__ = ['StageTimings']
+
+# collector of the current thread or task, looked up once per slugified text
+_active_timings: ContextVar[StageTimings | None] = ContextVar('slugify_stage_timings', default=None)
+
+
+class StageTimings:
+    """
+    Collector of the time spent in each stage of the slugify pipeline.
+
+    While the collector is active, every `slugify()` or `Slugifier` call made in the same thread or
+    asyncio task adds the time of each stage it runs to cumulative per-stage totals.  Stages a text
+    does not need (e.g. transliteration of ascii text) are not recorded.  The optional callback is
+    called with `(stage, seconds)` for every recorded stage, e.g. to forward it to a tracer.
+
+    >>> with StageTimings() as timings:
+    ...     slugs = [slugify(title) for title in titles]
+    >>> print(timings.report())
+
+    When no collector is active, slugify only pays for one context variable lookup per call.
+    """
+
+    def __init__(self, callback: Callable[[str, float], object] | None = None) -> None:
+        self.callback = callback
+        self.calls = 0
+        self.totals: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self._tokens: list[Token[StageTimings | None]] = []
+
+    def record(self, stage: str, seconds: float) -> None:
+        """ Add the time spent in one run of a stage """
+        self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+        if self.callback is not None:
+            self.callback(stage, seconds)
+
+    def start(self) -> Callable[[str], None]:
+        """
+        Start timing one slugify call.
+        :return (callable): to be called with the stage name at the end of each stage
+        """
+        self.calls += 1
+        clock = time.perf_counter
+        last = clock()
+
+        def lap(stage: str) -> None:
+            nonlocal last
+            now = clock()
+            self.record(stage, now - last)
+            # the bookkeeping above is not charged to the next stage
+            last = clock()
+
+        return lap
+
+    @property
+    def total(self) -> float:
+        """ Time spent in all stages, in seconds """
+        return sum(self.totals.values())
+
+    def reset(self) -> None:
+        """ Forget everything recorded so far """
+        self.calls = 0
+        self.totals.clear()
+        self.counts.clear()
+
+    def report(self) -> str:
+        """
+        Summary of the cumulative time per stage, slowest stage first.
+        :return (str): one line per stage with its runs, total and mean time and share of the total
+        """
+        total = self.total
+        lines = ['{} calls, {:.3f} ms in total'.format(self.calls, total * 1e3),
+                 '{:<18} {:>9} {:>12} {:>10} {:>7}'.format('stage', 'runs', 'total ms', 'mean us', 'share')]
+        for stage, seconds in sorted(self.totals.items(), key=lambda item: -item[1]):
+            runs = self.counts[stage]
+            lines.append('{:<18} {:>9} {:>12.3f} {:>10.2f} {:>6.1f}%'.format(
+                stage, runs, seconds * 1e3, seconds / runs * 1e6, 100 * seconds / total if total else 0.0))
+        return '\n'.join(lines)
+
+    def __enter__(self) -> StageTimings:
+        self._tokens.append(_active_timings.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _active_timings.reset(self._tokens.pop())
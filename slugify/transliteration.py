@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import functools
+import unicodedata
+from collections.abc import Callable
+from types import ModuleType
+
+__all__ = ['TableTransliterator', 'default_transliterator']
+
+BLOCK_SIZE = 256
+SURROGATES = range(0xD800, 0xE000)
+PRIVATE_USE = range(0xE000, 0xF900)
+# code points remembered by a TableTransliterator, texts spread over many blocks cannot grow it further
+TRANSLITERATION_TABLE_MAX_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=None)
+def _load_unidecode() -> ModuleType:
+    try:
+        import unidecode
+    except ImportError:
+        import text_unidecode as unidecode  # type: ignore[import-untyped, no-redef]
+    return unidecode
+
+
+def default_transliterator() -> Callable[[str], str]:
+    """ The installed transliteration backend, `unidecode` when available, else `text_unidecode` """
+    return _load_unidecode().unidecode  # type: ignore[no-any-return]
+
+
+def _fills_block(codepoint: int) -> bool:
+    """ Whether the block of a code point is worth filling at once: an assigned, public code point of the BMP """
+    if codepoint >= 0x10000 or codepoint in SURROGATES or codepoint in PRIVATE_USE:
+        return False
+    return unicodedata.category(chr(codepoint)) != 'Cn'
+
+
+class _BlockTable(dict[int, str]):
+    """ `str.translate` table which fills a whole block of code points on the first lookup in it """
+
+    def __init__(self, owner: TableTransliterator) -> None:
+        super().__init__()
+        self.owner = owner
+
+    def __missing__(self, codepoint: int) -> str:
+        return self.owner._fill(codepoint)
+
+
+class TableTransliterator:
+    """
+    Transliteration backend memoizing the results of another backend per code point.
+
+    The table is filled lazily one block of 256 code points at a time, so texts in scripts seen
+    before (Cyrillic, CJK, ...) are transliterated by a single `str.translate` call.  Private use,
+    unassigned and astral code points are remembered one at a time, and the table holds at most
+    TRANSLITERATION_TABLE_MAX_SIZE code points, further ones are transliterated without being stored.
+    A backend must transliterate text one character at a time, as `unidecode` and `text_unidecode` do.
+
+    >>> transliterate = TableTransliterator()
+    >>> transliterate('Déjà vu')
+    'Deja vu'
+    """
+
+    def __init__(self, backend: Callable[[str], str] | None = None) -> None:
+        self.backend = backend
+        self._table = _BlockTable(self)
+
+    def _fill(self, codepoint: int) -> str:
+        backend = self.backend or default_transliterator()
+        # surrogates are never filled by block, backends may warn about every surrogate they see
+        if not _fills_block(codepoint) or len(self._table) + BLOCK_SIZE > TRANSLITERATION_TABLE_MAX_SIZE:
+            result = backend(chr(codepoint))
+            if len(self._table) < TRANSLITERATION_TABLE_MAX_SIZE:
+                self._table[codepoint] = result
+            return result
+        start = codepoint - codepoint % BLOCK_SIZE
+        block = {point: backend(chr(point)) for point in range(start, start + BLOCK_SIZE)}
+        self._table.update(block)
+        return block[codepoint]
+
+    @property
+    def blocks(self) -> int:
+        """ Number of blocks with code points remembered so far """
+        return len({codepoint // BLOCK_SIZE for codepoint in self._table})
+
+    def __call__(self, text: str) -> str:
+        return text.translate(self._table)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Protocol
+
+from .slugify import Slugifier, smart_truncate
+
+__all__ = ['SlugStore', 'MemorySlugStore', 'SQLiteSlugStore', 'UniqueSlugAllocator']
+
+
+class SlugStore(Protocol):
+    """
+    Storage of a `UniqueSlugAllocator`: the used slugs plus a suffix counter per base slug.
+    Both operations must be atomic, as they are called concurrently.
+    """
+
+    def next_suffix(self, base: str) -> int:
+        """ Increment the counter of a base slug and return it, the first call returns 1 """
+        ...
+
+    def claim(self, slug: str) -> bool:
+        """ Mark a slug as used, return False if it already was """
+        ...
+
+
+class MemorySlugStore:
+    """ Thread-safe in-memory slug store """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.slugs: set[str] = set()
+        self._lock = threading.Lock()
+
+    def next_suffix(self, base: str) -> int:
+        with self._lock:
+            suffix = self.counters.get(base, 0) + 1
+            self.counters[base] = suffix
+            return suffix
+
+    def claim(self, slug: str) -> bool:
+        with self._lock:
+            if slug in self.slugs:
+                return False
+            self.slugs.add(slug)
+            return True
+
+
+class SQLiteSlugStore:
+    """
+    Slug store in a SQLite database.
+    Each operation runs in its own immediate transaction, so several processes can share the database file.
+    :param database (str): path of the database file, or ':memory:'
+    """
+
+    def __init__(self, database: str = ':memory:') -> None:
+        # keeps sqlite3 out of `import slugify`
+        import sqlite3
+
+        self.database = database
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            database, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS slug_counters (base TEXT PRIMARY KEY, suffix INTEGER NOT NULL)')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS slugs (slug TEXT PRIMARY KEY)')
+
+    def _transaction(self, *statements: tuple[str, tuple[Any, ...]]) -> tuple[list[Any], int]:
+        """ Run statements in one transaction, return the rows and row count of the last one """
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                for sql, parameters in statements:
+                    cursor = self._connection.execute(sql, parameters)
+                rows = cursor.fetchall()
+                self._connection.execute('COMMIT')
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            return rows, cursor.rowcount
+
+    def next_suffix(self, base: str) -> int:
+        rows, _ = self._transaction(
+            ('INSERT OR IGNORE INTO slug_counters (base, suffix) VALUES (?, 0)', (base,)),
+            ('UPDATE slug_counters SET suffix = suffix + 1 WHERE base = ?', (base,)),
+            ('SELECT suffix FROM slug_counters WHERE base = ?', (base,)),
+        )
+        return int(rows[0][0])
+
+    def claim(self, slug: str) -> bool:
+        _, count = self._transaction(('INSERT OR IGNORE INTO slugs (slug) VALUES (?)', (slug,)))
+        return count == 1
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class UniqueSlugAllocator:
+    """
+    Allocate slugs which are unique within a store.
+
+    The first text with a given slug gets the plain slug, later ones get a numbered suffix
+    (`hello-world`, `hello-world-2`, `hello-world-3`, ...).  The store keeps the last suffix
+    used for every base slug, so an allocation costs a single claim instead of trying every
+    suffix in turn; another one is only tried when a suffixed slug was already used, e.g. by
+    a text whose own slug ends with a number.  Suffixed slugs are shortened to still respect
+    `max_length`, and the suffix is joined with `separator`.  Allocations are thread-safe.
+
+    >>> allocate = UniqueSlugAllocator(max_length=20)
+    >>> allocate('Hello World'), allocate('Hello world!')
+    ('hello-world', 'hello-world-2')
+
+    :param store (SlugStore): used slugs and suffix counters, in memory by default
+    :param options: any keyword argument accepted by `slugify()`
+    """
+
+    def __init__(self, store: SlugStore | None = None, **options: Any) -> None:
+        self.store: SlugStore = store if store is not None else MemorySlugStore()
+        self.slugifier = Slugifier(**options)
+
+    def _with_suffix(self, base: str, suffix: int) -> str:
+        if suffix == 1:
+            return base
+        ending = '{}{}'.format(self.slugifier.separator, suffix) if base else str(suffix)
+        max_length = self.slugifier.max_length
+        if max_length > 0 and len(base) + len(ending) > max_length:
+            room = max_length - len(ending)
+            if room <= 0:
+                raise ValueError("max_length {} is too short for the suffix {!r}".format(max_length, ending))
+            base = smart_truncate(base, room, self.slugifier.word_boundary, self.slugifier.separator,
+                                  self.slugifier.save_order)
+        return base + ending
+
+    def reserve(self, slug: str) -> bool:
+        """
+        Mark an existing slug as used, e.g. one loaded from a database.
+        :param slug (str): slug to reserve
+        :return (bool): False if it was already used
+        """
+        return self.store.claim(slug)
+
+    def allocate(self, text: str) -> str:
+        """
+        Slugify a text and reserve a unique slug for it.
+        :param text (str): initial text
+        :return (str): the slug, with a numbered suffix if needed
+        """
+        base = self.slugifier(text)
+        while True:
+            slug = self._with_suffix(base, self.store.next_suffix(base))
+            if self.store.claim(slug):
+                return slug
+
+    __call__ = allocate
@@ -1,13 +1,63 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
+import importlib
 import io
+import os
+import pickle
+import re
+import sqlite3
+import subprocess
 import sys
+import tempfile
+import textwrap
+import threading
+import tracemalloc
+import unicodedata
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from unittest import mock
 
 from slugify import PRE_TRANSLATIONS
+from slugify import GERMAN
+from slugify import LANGUAGE_PROFILES
+from slugify import add_uppercase_char
+from slugify import pre_translator
+from slugify import register_language
 from slugify import slugify
 from slugify import smart_truncate
-from slugify.__main__ import slugify_params, parse_args
+from slugify import Slugifier
+from slugify import SlugCache
+from slugify import SQLiteSlugCache
+from slugify import SlugifyOptions
+from slugify import slugify_many
+from slugify import slugify_parallel
+from slugify import MultiReplacer
+from slugify import TableTransliterator
+from slugify import default_transliterator
+from slugify import StageTimings
+from slugify import UniqueSlugAllocator
+from slugify import MemorySlugStore
+from slugify import SQLiteSlugStore
+from slugify import aslugify
+from slugify import aslugify_many
+from slugify import slugify_array
+from slugify import is_slug
+from slugify.__main__ import slugify_params, parse_args, read_records, main
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+slugify_module = importlib.import_module('slugify.slugify')
+options_module = importlib.import_module('slugify.options')
+transliteration_module = importlib.import_module('slugify.transliteration')
 
 
 class TestSlugify(unittest.TestCase):
@@ -181,6 +231,16 @@ class TestSlugify(unittest.TestCase):
         r = slugify(txt, hexadecimal=False)
         self.assertEqual(r, 'x17d')
 
+    def test_html_references_invalid_code_point(self):
+        txt = '&#99999999; &#381; &#x110000; &#x17D; &nosuchentity; &amp;'
+        r = slugify(txt)
+        self.assertEqual(r, "99999999-z-x110000-z-nosuchentity")
+
+    def test_html_references_decoded_once(self):
+        txt = 'AT&amp;#38;T'
+        r = slugify(txt)
+        self.assertEqual(r, "at-38-t")
+
     def test_starts_with_number(self):
         txt = '10 amazing secrets'
         r = slugify(txt)
@@ -240,6 +300,24 @@ class TestSlugify(unittest.TestCase):
     def test_pre_translation(self):
         self.assertEqual(PRE_TRANSLATIONS, [('Ю', 'U'), ('Щ', 'Sch'), ('У', 'Y'), ('Х', 'H'), ('Я', 'Ya'), ('Ё', 'E'), ('ё', 'e'), ('я', 'ya'), ('х', 'h'), ('у', 'y'), ('щ', 'sch'), ('ю', 'u'), ('Ü', 'Ue'), ('Ö', 'Oe'), ('Ä', 'Ae'), ('ä', 'ae'), ('ö', 'oe'), ('ü', 'ue'), ('Ϋ́', 'Y'), ('Ϋ', 'Y'), ('Ύ', 'Y'), ('Υ', 'Y'), ('Χ', 'Ch'), ('χ', 'ch'), ('Ξ', 'X'), ('ϒ', 'Y'), ('υ', 'y'), ('ύ', 'y'), ('ϋ', 'y'), ('ΰ', 'y')])
 
+    def test_pre_translations_option(self):
+        txt = 'Компьютер Über Χάος'
+        r = slugify(txt, pre_translations=['cyrillic', 'german', 'greek'])
+        self.assertEqual(r, slugify(txt, replacements=PRE_TRANSLATIONS))
+        self.assertEqual(r, "komputer-ueber-chaos")
+
+        r = slugify(txt, pre_translations='german')
+        self.assertEqual(r, "kompiuter-ueber-khaos")
+
+    def test_pre_translations_after_replacements(self):
+        txt = 'Über'
+        r = slugify(txt, pre_translations=['german'], replacements=[['Ü', 'U']])
+        self.assertEqual(r, "uber")
+
+    def test_pre_translations_unknown_language(self):
+        with self.assertRaises(ValueError):
+            slugify('text', pre_translations=['klingon'])
+
 
 class TestSlugifyUnicode(unittest.TestCase):
     def test_extraneous_seperators(self):
@@ -528,6 +606,935 @@ class TestSlugifyUnicode(unittest.TestCase):
         self.assertEqual(r, "🦄")
 
 
+class TestSlugifier(unittest.TestCase):
+
+    def test_matches_slugify(self):
+        texts = ['This is a test ---', 'C\'est déjà l\'été.', '影師嗎', '1,000 reasons you are #1',
+                 'foo &amp; bar &#381; &#x17D;', 'the quick brown fox jumps over the lazy dog']
+        options = [
+            {},
+            {'allow_unicode': True},
+            {'max_length': 15, 'word_boundary': True, 'save_order': True},
+            {'separator': '.', 'stopwords': ['the', 'Fox']},
+            {'stopwords': ['Fox'], 'lowercase': False},
+            {'regex_pattern': r'[^-a-z0-9_]+', 'entities': False, 'decimal': False, 'hexadecimal': False},
+            {'replacements': [['|', 'or'], ['%', 'percent'], ['fox', 'cat']]},
+        ]
+        for kwargs in options:
+            slugifier = Slugifier(**kwargs)
+            for txt in texts:
+                self.assertEqual(slugifier(txt), slugify(txt, **kwargs))
+
+    def test_reusable(self):
+        slugifier = Slugifier(separator='_', stopwords=['the'])
+        self.assertEqual(slugifier('The quick brown fox'), 'quick_brown_fox')
+        self.assertEqual(slugifier('the lazy dog'), 'lazy_dog')
+
+    def test_options_are_materialized(self):
+        slugifier = Slugifier(stopwords=(w for w in ['the']), replacements=(r for r in [['|', 'or']]))
+        self.assertEqual(slugifier('the cat | the dog'), 'cat-or-dog')
+        self.assertEqual(slugifier('the cat | the dog'), 'cat-or-dog')
+
+
+class TestSlugCache(unittest.TestCase):
+
+    def test_matches_slugify(self):
+        cache = SlugCache()
+        txt = 'jaja---lol-méméméoo--a'
+        self.assertEqual(cache.slugify(txt), slugify(txt))
+        self.assertEqual(cache.slugify(txt, max_length=15, word_boundary=True), "jaja-lol-a")
+        self.assertEqual(cache.slugify(txt, stopwords=['lol']), "jaja-mememeoo-a")
+
+    def test_hits_and_misses(self):
+        cache = SlugCache()
+        cache.slugify('This is a test')
+        cache.slugify('This is a test')
+        cache.slugify('This is a test', separator='_')
+        cache.slugify('This is a test', stopwords=['a'])
+        cache.slugify('This is a test', stopwords=('a',))
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 3, 3))
+
+    def test_lru_eviction(self):
+        cache = SlugCache(maxsize=2)
+        cache.slugify('one')
+        cache.slugify('two')
+        cache.slugify('one')
+        cache.slugify('three')
+        self.assertEqual(cache.info().evictions, 1)
+        self.assertEqual(len(cache), 2)
+        cache.slugify('one')
+        self.assertEqual(cache.info().hits, 2)
+        cache.slugify('two')
+        self.assertEqual(cache.info().misses, 4)
+
+    def test_long_text_not_stored(self):
+        cache = SlugCache(max_text_length=10)
+        self.assertEqual(cache.slugify('a very long title indeed'), 'a-very-long-title-indeed')
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = SlugCache()
+        cache.slugify('one')
+        cache.slugify('one')
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 1024, 0))
+
+    def test_shared_between_threads(self):
+        cache = SlugCache(maxsize=50)
+        texts = ['title %d' % (i % 80) for i in range(400)]
+
+        def work():
+            for txt in texts:
+                self.assertEqual(cache.slugify(txt), slugify(txt))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 1600)
+        self.assertLessEqual(info.currsize, 50)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            SlugCache(maxsize=0)
+
+    def test_transliterator_option(self):
+        cache = SlugCache()
+        table = TableTransliterator()
+        for transliterator in (str.lower, table, table, lambda text: text.upper()):
+            self.assertEqual(cache.slugify('Ünïcödé', transliterator=transliterator),
+                             slugify('Ünïcödé', transliterator=transliterator))
+            self.assertEqual(cache.slugify('Ünïcödé', transliterator=transliterator),
+                             slugify('Ünïcödé', transliterator=transliterator))
+        self.assertEqual(cache.info().hits, 5)
+
+
+class TestSQLiteSlugCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'slugs.db')
+
+    def open(self, **kwargs):
+        cache = SQLiteSlugCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_matches_slugify(self):
+        cache = self.open()
+        txt = 'jaja---lol-méméméoo--a'
+        for options in [{}, {'max_length': 15, 'word_boundary': True}, {'stopwords': ['lol']}]:
+            self.assertEqual(cache.slugify(txt, **options), slugify(txt, **options))
+            self.assertEqual(cache.slugify(txt, **options), slugify(txt, **options))
+        self.assertEqual(cache.info(), (3, 3, 0, cache.maxsize, 3))
+
+    def test_partial_transliterators_are_kept_apart(self):
+        cache = self.open()
+        for repl in ('x', 'y'):
+            transliterator = functools.partial(re.sub, '[aeiou]', repl)
+            self.assertEqual(cache.slugify('bean', transliterator=transliterator),
+                             slugify('bean', transliterator=transliterator))
+        self.assertEqual(cache.info().currsize, 2)
+        with self.assertRaises(TypeError):
+            cache.slugify('bean', transliterator=lambda text: text)
+
+    def test_persists_and_is_shared(self):
+        texts = ['Hello World', '影師嗎', '!!!', 'Hello World']
+        first = self.open()
+        self.assertEqual(list(first.slugify_many(texts)), ['hello-world', 'ying-shi-ma', '', 'hello-world'])
+        self.assertEqual((first.info().misses, len(first)), (4, 3))
+        first.close()
+        second, third = self.open(), self.open()
+        self.assertEqual(list(second.slugify_many(texts)), ['hello-world', 'ying-shi-ma', '', 'hello-world'])
+        self.assertEqual(second.info().hits, 4)
+        self.assertEqual(third.get_many(texts), {'Hello World': 'hello-world', '影師嗎': 'ying-shi-ma', '!!!': ''})
+        self.assertEqual(third.get_many(texts, separator='_'), {})
+
+    def test_batches(self):
+        cache = self.open()
+        items = [('key%d' % i, 'Title %d' % (i % 700)) for i in range(1500)] + ['Plain Title']
+        expected = [(key, slugify(txt)) for key, txt in items[:-1]] + ['plain-title']
+        self.assertEqual(list(cache.slugify_many(items, batch_size=600)), expected)
+        self.assertEqual(len(cache), 701)
+        self.assertEqual(list(cache.slugify_many(items, batch_size=600)), expected)
+        self.assertEqual(cache.info().hits, 800 + 1501)
+        with self.assertRaises(ValueError):
+            cache.slugify_many(items, batch_size=0)
+
+    def test_database_cursor(self):
+        cache = self.open()
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        connection.executescript("CREATE TABLE t (id, title); INSERT INTO t VALUES (1, 'Hello World'), (2, 'Tiny')")
+        self.assertEqual(list(cache.slugify_many(connection.execute('SELECT title FROM t'))), ['hello-world', 'tiny'])
+        self.assertEqual(list(cache.slugify_many(connection.execute('SELECT id, title FROM t'))),
+                         [(1, 'hello-world'), (2, 'tiny')])
+
+    def test_put_many(self):
+        cache = self.open()
+        cache.put_many({'Hello World': 'hello_world'}, separator='_')
+        self.assertEqual(cache.slugify('Hello World', separator='_'), 'hello_world')
+        self.assertEqual(cache.slugify('Hello World'), 'hello-world')
+
+    def test_eviction(self):
+        cache = self.open(maxsize=3)
+        list(cache.slugify_many(['one', 'two', 'three', 'four', 'five']))
+        self.assertEqual(cache.info().evictions, 2)
+        self.assertEqual(set(cache.get_many(['one', 'two', 'three', 'four', 'five'])), {'three', 'four', 'five'})
+
+    def test_long_text_not_stored(self):
+        cache = self.open(max_text_length=10)
+        self.assertEqual(cache.slugify('a very long title indeed'), 'a-very-long-title-indeed')
+        self.assertEqual(cache.slugify(b'bytes'), 'bytes')
+        self.assertEqual(len(cache), 0)
+
+    def test_equivalent_options_share_entries(self):
+        cache = self.open()
+        cache.slugify('The Title', stopwords=['the', 'a'])
+        self.assertEqual(cache.slugify('The Title', stopwords=('A', 'The')), 'title')
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_clear(self):
+        cache = self.open()
+        cache.slugify('one')
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, cache.maxsize, 0))
+
+    def test_concurrent_connections(self):
+        caches = [self.open() for _ in range(4)]
+        texts = ['title %d' % (i % 300) for i in range(600)]
+
+        def work(cache):
+            self.assertEqual(list(cache.slugify_many(texts, batch_size=50)), [slugify(txt) for txt in texts])
+
+        threads = [threading.Thread(target=work, args=(cache,)) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(caches[0]), 300)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            SQLiteSlugCache(maxsize=0)
+
+
+class TestSlugifyOptions(unittest.TestCase):
+
+    def test_canonical(self):
+        options = SlugifyOptions(stopwords=['The', 'a', 'the'], replacements=[['|', 'or']], regex_pattern='[^a-z]+',
+                                 pre_translations='german', max_length=20)
+        self.assertEqual(options, SlugifyOptions(max_length=20, stopwords=('a', 'the'), replacements=(('|', 'or'),),
+                                                 regex_pattern=re.compile('[^a-z]+'), pre_translations=['german']))
+        self.assertEqual(hash(options), hash(SlugifyOptions(**options._asdict())))
+        self.assertEqual(options.stopwords, ('a', 'the'))
+        self.assertEqual(SlugifyOptions(stopwords=['The'], lowercase=False).stopwords, ('The',))
+        self.assertNotEqual(options, SlugifyOptions(max_length=20))
+        self.assertEqual(SlugifyOptions(regex_pattern=''), SlugifyOptions())
+
+    def test_same_slugs(self):
+        options = dict(stopwords=['The'], replacements=[['|', 'or']], separator='_', max_length=20)
+        txt = 'The cat | the dog and the bird'
+        self.assertEqual(slugify(txt, **SlugifyOptions(**options)._asdict()), slugify(txt, **options))
+
+    def test_immutable_and_picklable(self):
+        options = SlugifyOptions(stopwords=['a'], regex_pattern='[^a-z]+', transliterator=default_transliterator())
+        with self.assertRaises(AttributeError):
+            options.max_length = 10  # type: ignore[misc]
+        copy = pickle.loads(pickle.dumps(options))
+        self.assertEqual(copy, options)
+        self.assertEqual(copy.digest, options.digest)
+        self.assertEqual(copy.max_length, 0)
+        self.assertIs(type(copy), SlugifyOptions)
+
+    def test_digest(self):
+        options = SlugifyOptions(stopwords=['a'], regex_pattern='[^a-z]+', transliterator=str.lower)
+        self.assertRegex(options.digest, '^[0-9a-f]{32}$')
+        self.assertNotEqual(options.digest, SlugifyOptions().digest)
+        self.assertNotEqual(SlugifyOptions(transliterator=TableTransliterator(str.upper)).digest,
+                            SlugifyOptions(transliterator=TableTransliterator(str.lower)).digest)
+        self.assertNotIn('0x', repr(options_module._stable(tuple(options._asdict().items()))))
+
+    def test_digest_of_partial_transliterators(self):
+        first = SlugifyOptions(transliterator=functools.partial(re.sub, '[aeiou]', 'x'))
+        second = SlugifyOptions(transliterator=functools.partial(re.sub, '[aeiou]', 'y'))
+        self.assertNotEqual(first.digest, second.digest)
+        self.assertEqual(first.digest, SlugifyOptions(transliterator=functools.partial(re.sub, '[aeiou]', 'x')).digest)
+
+    def test_digest_rejects_callables_without_identity(self):
+        def local(text):
+            return text
+
+        for transliterator in (lambda text: text, local, 'text'.join, functools.partial(lambda text: text)):
+            with self.assertRaises(TypeError):
+                SlugifyOptions(transliterator=transliterator).digest
+
+    def test_digest_covers_version_and_backend(self):
+        digest = SlugifyOptions().digest
+        with mock.patch.object(options_module, '__version__', '0.0.0'):
+            self.assertNotEqual(SlugifyOptions().digest, digest)
+        with mock.patch.object(options_module, 'default_transliterator', lambda: textwrap.dedent):
+            self.assertNotEqual(SlugifyOptions().digest, digest)
+        self.assertEqual(SlugifyOptions().digest, digest)
+
+    def test_digest_is_the_same_in_every_process(self):
+        code = "from slugify import SlugifyOptions; print(SlugifyOptions(stopwords=['a'], max_length=9).digest)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), SlugifyOptions(stopwords=['a'], max_length=9).digest)
+
+
+class TestSlugifyMany(unittest.TestCase):
+
+    def test_texts(self):
+        texts = ['This is a test ---', '影師嗎', 'Компьютер']
+        r = slugify_many(texts, separator='_')
+        self.assertEqual(list(r), ['this_is_a_test', 'ying_shi_ma', 'kompiuter'])
+
+    def test_keyed_pairs(self):
+        rows = [(1, 'The quick brown fox'), ('b', 'the lazy dog')]
+        r = slugify_many(rows, stopwords=['the'])
+        self.assertEqual(list(r), [(1, 'quick-brown-fox'), ('b', 'lazy-dog')])
+
+    def test_database_cursor(self):
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        connection.executescript("CREATE TABLE t (id, title); INSERT INTO t VALUES (1, 'Hello World'), (2, 'Tiny')")
+        self.assertEqual(list(slugify_many(connection.execute('SELECT title FROM t'))), ['hello-world', 'tiny'])
+        self.assertEqual(list(slugify_many(connection.execute('SELECT id, title FROM t'))),
+                         [(1, 'hello-world'), (2, 'tiny')])
+        with self.assertRaises(ValueError):
+            list(slugify_many([(1, 'a', 'b')]))
+
+    def test_lazy(self):
+        def texts():
+            yield 'one'
+            raise RuntimeError('consumed too far')
+
+        r = slugify_many(texts())
+        self.assertEqual(next(r), 'one')
+
+    def test_file_object(self):
+        r = slugify_many(io.StringIO('first line\nsecond line\n'))
+        self.assertEqual(list(r), ['first-line', 'second-line'])
+
+
+class TestSlugifyParallel(unittest.TestCase):
+
+    def test_matches_serial_in_order(self):
+        texts = ['Title number %d — déjà vu' % i for i in range(50)]
+        r = slugify_parallel(texts, workers=2, chunksize=7, max_length=20)
+        self.assertEqual(list(r), [slugify(txt, max_length=20) for txt in texts])
+
+    def test_keyed_pairs(self):
+        rows = [(i, 'Row %d' % i) for i in range(5)]
+        r = slugify_parallel(rows, workers=2, chunksize=2, separator='_')
+        self.assertEqual(list(r), [(i, 'row_%d' % i) for i in range(5)])
+
+    def test_empty(self):
+        self.assertEqual(list(slugify_parallel([], workers=1)), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            slugify_parallel([], workers=0)
+        with self.assertRaises(ValueError):
+            slugify_parallel([], chunksize=0)
+
+
+class TestAsciiFastPath(unittest.TestCase):
+    # a trailing combining mark vanishes from every slug but forces the full unicode pipeline
+    FORCE_UNICODE = ' \u0301'
+
+    CASES = [
+        ("This is a test ---", {}),
+        ("___This is a test___", {}),
+        ("This -- is a ## test ---", {}),
+        ("jaja---lol-mememeoo--a", {'max_length': 15, 'word_boundary': True}),
+        ("jaja---lol-mememeoo--a", {'max_length': 20, 'word_boundary': True, 'separator': '.'}),
+        ("one two three four five", {'max_length': 13, 'word_boundary': True, 'save_order': True}),
+        ("the quick brown fox jumps over the lazy dog in a hurry", {'stopwords': ['the', 'in', 'a', 'hurry']}),
+        ("thIs Has a stopword Stopword", {'stopwords': ['Stopword'], 'lowercase': False}),
+        ("foo &amp; bar", {}),
+        ("&#381;", {}),
+        ("&#x17D;", {}),
+        ("&#x17D;", {'hexadecimal': False}),
+        ("1,000 reasons you are #1", {}),
+        ("C'est deja l'ete.", {}),
+        ("___This is a test___", {'regex_pattern': r'[^-a-z0-9_]+'}),
+        ("___This is a test___", {'separator': '_', 'regex_pattern': r'[^-a-z0-9_]+'}),
+        ("10 | 20 %", {'replacements': [['|', 'or'], ['%', 'percent']]}),
+    ]
+
+    def test_ascii_stages_are_identity(self):
+        ascii_chars = ''.join(chr(i) for i in range(128))
+        self.assertEqual(unicodedata.normalize('NFKD', ascii_chars), ascii_chars)
+        self.assertEqual(unicodedata.normalize('NFKC', ascii_chars), ascii_chars)
+        self.assertEqual(slugify_module.unidecode.unidecode(ascii_chars), ascii_chars)
+
+    def test_equivalent_to_full_pipeline(self):
+        for allow_unicode in (False, True):
+            for txt, kwargs in self.CASES:
+                self.assertTrue(txt.isascii())
+                fast = slugify(txt, allow_unicode=allow_unicode, **kwargs)
+                full = slugify(txt + self.FORCE_UNICODE, allow_unicode=allow_unicode, **kwargs)
+                self.assertEqual(fast, full, (txt, kwargs, allow_unicode))
+
+
+class TestMultiReplacer(unittest.TestCase):
+
+    def sequential(self, rules, text):
+        for old, new in rules:
+            text = text.replace(old, new)
+        return text
+
+    def test_compiled_once_per_rule_list(self):
+        first = Slugifier(replacements=[['|', 'or'], ['%', 'percent']])
+        second = Slugifier(replacements=(('|', 'or'), ('%', 'percent')))
+        self.assertIsNotNone(first._replacer)
+        self.assertIs(first._replacer, second._replacer)
+        self.assertIsNone(Slugifier(replacements=[['a', 'b'], ['b', 'c']])._replacer)
+
+    def test_single_characters(self):
+        replace = MultiReplacer([['|', 'or'], ['%', 'percent']])
+        self.assertEqual(replace('10 | 20 %'), '10 or 20 percent')
+
+    def test_longest_match_wins(self):
+        replace = MultiReplacer([['a', '1'], ['abc', '3'], ['ab', '2']])
+        self.assertEqual(replace('abcabxa'), '32x1')
+
+    def test_first_rule_wins_for_duplicates(self):
+        replace = MultiReplacer([['ab', 'x'], ['ab', 'y']])
+        self.assertEqual(replace('abab'), 'xx')
+
+    def test_pre_translations(self):
+        replace = MultiReplacer(PRE_TRANSLATIONS)
+        self.assertTrue(replace.sequential_equivalent)
+        txt = 'Ёлка Über Χάος Ϋ́ υ'
+        self.assertEqual(replace(txt), self.sequential(PRE_TRANSLATIONS, txt))
+
+    def test_sequential_equivalent(self):
+        self.assertTrue(MultiReplacer([['&&', 'and'], ['||', 'or'], ['&', 'et']]).sequential_equivalent)
+        self.assertFalse(MultiReplacer([['|', 'or'], ['or', 'and']]).sequential_equivalent)
+        self.assertFalse(MultiReplacer([['b', 'x'], ['ab', 'y']]).sequential_equivalent)
+        self.assertFalse(MultiReplacer([['ab', 'x'], ['bc', 'y']]).sequential_equivalent)
+        self.assertFalse(MultiReplacer([['-', ''], ['ab', 'y']]).sequential_equivalent)
+
+    def test_empty_original(self):
+        with self.assertRaises(ValueError):
+            MultiReplacer([['', 'x']])
+
+    def test_slugify_keeps_sequential_semantics(self):
+        r = slugify('a | b', replacements=[['|', 'or'], ['or', 'and']])
+        self.assertEqual(r, 'a-and-b')
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_heavy_resources_are_loaded_on_first_use(self):
+        code = (
+            "import sys, slugify\n"
+            "lazy = ['unidecode', 'text_unidecode', 'html.entities', 'multiprocessing', 'sqlite3', 'asyncio', 'hashlib']\n"
+            "print(sorted(name for name in lazy if name in sys.modules))\n"
+            "print(slugify.slugify('D\u00e9j\u00e0 vu &amp; &eacute;'))\n"
+            "print('html.entities' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ['[]', 'deja-vu-e', 'True'])
+
+    def test_optional_apis_are_loaded_on_first_use(self):
+        code = (
+            "import sys, slugify\n"
+            "optional = ['options', 'cache', 'batch', 'unique', 'aio', 'array']\n"
+            "print(sorted(name for name in optional if 'slugify.' + name in sys.modules))\n"
+            "print(slugify.SlugCache().slugify('Hello World'), 'slugify.cache' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ['[]', 'hello-world', 'True'])
+
+    def test_package_exports(self):
+        package = importlib.import_module('slugify')
+        for name in ['options', 'cache', 'batch', 'unique', 'aio', 'array', 'special', 'slugify', 'timing']:
+            module = importlib.import_module('slugify.' + name)
+            for exported in module.__all__:
+                self.assertIn(exported, package.__all__)
+                self.assertIs(getattr(package, exported), getattr(module, exported))
+        self.assertIn('slugify_array', dir(package))
+        with self.assertRaises(AttributeError):
+            package.MISSING_ATTRIBUTE
+
+    def test_module_attributes(self):
+        self.assertTrue(slugify_module.CHAR_ENTITY_PATTERN.match('&amp;'))
+        self.assertEqual(slugify_module.unidecode.unidecode('é'), 'e')
+        with self.assertRaises(AttributeError):
+            slugify_module.MISSING_ATTRIBUTE
+
+
+class TestLanguageProfiles(unittest.TestCase):
+
+    def tearDown(self):
+        LANGUAGE_PROFILES.pop('test-polish', None)
+        pre_translator.cache_clear()
+
+    def test_builtin_profiles(self):
+        self.assertEqual(sorted(LANGUAGE_PROFILES), ['cyrillic', 'german', 'greek'])
+        self.assertEqual(LANGUAGE_PROFILES['german'], GERMAN)
+
+    def test_register_language(self):
+        register_language('test-polish', [('ł', 'l'), ('ż', 'z')])
+        self.assertEqual(LANGUAGE_PROFILES['test-polish'], [('Ż', 'Z'), ('Ł', 'L'), ('ł', 'l'), ('ż', 'z')])
+        r = slugify('Łódź żółw', pre_translations=['test-polish'], allow_unicode=True)
+        self.assertEqual(r, 'lódź-zólw')
+
+    def test_pre_translator_is_compiled_once(self):
+        self.assertIs(pre_translator('cyrillic', 'greek'), pre_translator('cyrillic', 'greek'))
+        self.assertEqual(pre_translator('german')('Ärger über Öl'), 'Aerger ueber Oel')
+
+    def test_add_uppercase_char(self):
+        r = add_uppercase_char([('ä', 'ae'), ('ß', 'ss'), ('Ξ', 'X')])
+        self.assertEqual(r, [('SS', 'Ss'), ('Ä', 'Ae'), ('ä', 'ae'), ('ß', 'ss'), ('Ξ', 'X')])
+
+
+class TestTransliteration(unittest.TestCase):
+
+    def test_table_matches_backend(self):
+        transliterate = TableTransliterator()
+        backend = default_transliterator()
+        for txt in ['Crème brûlée', 'Компьютер', 'Χάος', '影師嗎', 'i love 🦄', 'plain ascii']:
+            self.assertEqual(transliterate(txt), backend(txt))
+            self.assertEqual(transliterate(txt), backend(txt))
+
+    def test_table_is_filled_by_block(self):
+        calls = []
+
+        def backend(text):
+            calls.append(text)
+            return text.upper()
+
+        transliterate = TableTransliterator(backend)
+        self.assertEqual(transliterate('ab'), 'AB')
+        self.assertEqual(transliterate('ba c'), 'BA C')
+        self.assertEqual((transliterate.blocks, len(calls)), (1, 256))
+        self.assertEqual(transliterate('я'), 'Я')
+        self.assertEqual((transliterate.blocks, len(calls)), (2, 512))
+
+    def test_table_surrogates_are_not_prefilled(self):
+        transliterate = TableTransliterator(lambda text: '?')
+        self.assertEqual(transliterate('\ud800'), '?')
+        self.assertEqual(transliterate.blocks, 1)
+        self.assertEqual(len(transliterate._table), 1)
+
+    def test_table_private_use_and_astral_are_not_prefilled(self):
+        transliterate = TableTransliterator(lambda text: '?')
+        self.assertEqual(transliterate('\ue000\U0001f984\u0378'), '???')
+        self.assertEqual(len(transliterate._table), 3)
+
+    def test_table_is_bounded(self):
+        calls = []
+
+        def backend(text):
+            calls.append(text)
+            return text
+
+        # one code point in every block of the Unicode range
+        txt = ''.join(chr(start) for start in range(0x20, 0x110000, 256) if start not in transliteration_module.SURROGATES)
+        transliterate = TableTransliterator(backend)
+        self.assertEqual(transliterate(txt), txt)
+        self.assertLessEqual(len(transliterate._table), transliteration_module.TRANSLITERATION_TABLE_MAX_SIZE)
+        self.assertLessEqual(len(calls), transliteration_module.TRANSLITERATION_TABLE_MAX_SIZE + len(txt))
+        self.assertEqual(transliterate(txt), txt)
+
+    def test_slugify_transliterator_option(self):
+        txt = 'Компьютер 影師嗎'
+        self.assertEqual(slugify(txt, transliterator=TableTransliterator()), slugify(txt))
+        r = slugify(txt, transliterator=lambda text: 'custom')
+        self.assertEqual(r, 'custom')
+
+    def test_transliterator_skipped_for_ascii(self):
+        r = slugify('plain text', transliterator=lambda text: 'custom')
+        self.assertEqual(r, 'plain-text')
+
+
+class TestStageTimings(unittest.TestCase):
+
+    def test_records_stages_run(self):
+        with StageTimings() as timings:
+            slugify("Déjà vu &amp; the fox's", stopwords=['the'], max_length=10, separator='_')
+            slugify('plain text')
+        self.assertEqual(timings.calls, 2)
+        self.assertEqual(set(timings.totals), {
+            'quotes', 'normalize', 'transliterate', 'entities', 'cleanup', 'stopwords', 'truncate',
+            'separator'})
+        self.assertEqual(timings.counts['cleanup'], 2)
+        self.assertEqual(timings.counts['transliterate'], 1)
+        self.assertTrue(all(seconds >= 0 for seconds in timings.totals.values()))
+        self.assertAlmostEqual(timings.total, sum(timings.totals.values()))
+
+    def test_long_text_counts_once(self):
+        txt = ' '.join(['averyverylongword'] * 5000 + ['fits'])
+        with StageTimings() as timings:
+            r = slugify(txt, max_length=10, word_boundary=True, separator='_')
+        self.assertEqual(r, 'fits')
+        self.assertEqual(timings.calls, 1)
+        self.assertEqual((timings.counts['truncate'], timings.counts['separator']), (1, 1))
+        self.assertGreater(timings.counts['cleanup'], 1)
+
+    def test_inactive_outside_context(self):
+        timings = StageTimings()
+        slugify('text')
+        with timings:
+            slugify('text')
+        slugify('text')
+        self.assertEqual(timings.calls, 1)
+
+    def test_nested_collectors(self):
+        with StageTimings() as outer:
+            with StageTimings() as inner:
+                slugify('text')
+            slugify('text')
+        self.assertEqual((outer.calls, inner.calls), (1, 1))
+
+    def test_callback(self):
+        stages = []
+        with StageTimings(callback=lambda stage, seconds: stages.append(stage)):
+            slugify('text', replacements=[['x', 'y']])
+        self.assertEqual(stages, ['replacements', 'cleanup', 'replacements'])
+
+    def test_renormalize_only_after_changes(self):
+        with StageTimings() as timings:
+            slugify('東京都の天気予報 ﾃｷｽﾄ', allow_unicode=True)
+            slugify('مَرْحَبًا بالعالم', allow_unicode=True)
+            slugify('Déjà vu &amp; more')
+        self.assertEqual(timings.counts['normalize'], 3)
+        self.assertNotIn('renormalize', timings.counts)
+        with StageTimings() as timings:
+            self.assertEqual(slugify('東京 &#xFF83;&#xFF77;', allow_unicode=True), '東京-テキ')
+            self.assertEqual(slugify('é', transliterator=lambda text: '\ufb01le'), 'file')
+        self.assertEqual(timings.counts['renormalize'], 2)
+
+    def test_report_and_reset(self):
+        with StageTimings() as timings:
+            slugify('Компьютер')
+        report = timings.report()
+        self.assertIn('1 calls', report)
+        self.assertIn('transliterate', report)
+        timings.reset()
+        self.assertEqual((timings.calls, timings.totals), (0, {}))
+        self.assertIn('0 calls', timings.report())
+
+
+class TestPrefixBudget(unittest.TestCase):
+
+    TEXT = ' '.join(['Crème &amp; brûlée', "l'été", 'Компьютер', 'the', '1,000', 'averyverylongword', 'ok'] * 600)
+
+    def assertSameAsFullPipeline(self, text, **options):
+        slugifier = Slugifier(**options)
+        self.assertIsNotNone(slugifier._prefix_min_length)
+        full = Slugifier(**options)
+        full._prefix_min_length = None
+        self.assertEqual(slugifier(text), full(text))
+
+    def test_same_result_as_full_pipeline(self):
+        for max_length in [1, 5, 17, 60, 1000, 5000]:
+            for word_boundary in [False, True]:
+                for save_order in [False, True]:
+                    self.assertSameAsFullPipeline(self.TEXT, max_length=max_length, word_boundary=word_boundary,
+                                                  save_order=save_order)
+
+    def test_same_result_with_options(self):
+        self.assertSameAsFullPipeline(self.TEXT, max_length=30, stopwords=['the', 'ok'], separator='_')
+        self.assertSameAsFullPipeline(self.TEXT, max_length=30, word_boundary=True, allow_unicode=True)
+        self.assertSameAsFullPipeline(self.TEXT.encode(), max_length=30, lowercase=False)
+        self.assertSameAsFullPipeline(self.TEXT, max_length=30, pre_translations=['cyrillic'])
+        # the budget is only filled near the end of the text
+        text = ' '.join(['averyverylongword'] * 5000 + ['fits'])
+        self.assertSameAsFullPipeline(text, max_length=10, word_boundary=True)
+        self.assertSameAsFullPipeline(text, max_length=10, word_boundary=True, save_order=True)
+
+    def test_not_used_when_unsafe(self):
+        self.assertIsNone(Slugifier()._prefix_min_length)
+        self.assertIsNone(Slugifier(max_length=10, replacements=[['a', 'b']])._prefix_min_length)
+        self.assertIsNone(Slugifier(max_length=10, regex_pattern=r'[^a-z]+')._prefix_min_length)
+        self.assertIsNone(Slugifier(max_length=10, transliterator=str.upper)._prefix_min_length)
+
+    def test_memory_depends_on_max_length(self):
+        text = 'word ' * 1000000
+        tracemalloc.start()
+        try:
+            self.assertEqual(slugify(text, max_length=9), 'word-word')
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 100000)
+
+
+class TestUniqueSlugAllocator(unittest.TestCase):
+
+    def stores(self):
+        return [MemorySlugStore(), SQLiteSlugStore()]
+
+    def test_suffixes(self):
+        for store in self.stores():
+            allocate = UniqueSlugAllocator(store)
+            slugs = [allocate('Hello World') for _ in range(3)]
+            self.assertEqual(slugs, ['hello-world', 'hello-world-2', 'hello-world-3'])
+            self.assertEqual(allocate('Other'), 'other')
+
+    def test_skips_used_slugs(self):
+        for store in self.stores():
+            allocate = UniqueSlugAllocator(store)
+            self.assertEqual(allocate('Hello World 2'), 'hello-world-2')
+            self.assertTrue(allocate.reserve('hello-world-3'))
+            self.assertFalse(allocate.reserve('hello-world-3'))
+            slugs = [allocate('Hello World') for _ in range(3)]
+            self.assertEqual(slugs, ['hello-world', 'hello-world-4', 'hello-world-5'])
+
+    def test_max_length_and_separator(self):
+        allocate = UniqueSlugAllocator(max_length=12, word_boundary=True, separator='_')
+        slugs = [allocate('Hello big world') for _ in range(11)]
+        self.assertEqual(slugs[:3], ['hello_big', 'hello_big_2', 'hello_big_3'])
+        self.assertEqual(slugs[-1], 'hello_big_11')
+        allocate = UniqueSlugAllocator(max_length=11)
+        self.assertEqual([allocate('Hello World') for _ in range(2)], ['hello-world', 'hello-wor-2'])
+        self.assertTrue(all(len(slug) <= 12 for slug in slugs))
+
+    def test_max_length_too_short(self):
+        allocate = UniqueSlugAllocator(max_length=2)
+        self.assertEqual(allocate('Hello'), 'he')
+        with self.assertRaises(ValueError):
+            allocate('Hello')
+
+    def test_threads(self):
+        for store in self.stores():
+            allocate = UniqueSlugAllocator(store)
+            slugs = []
+
+            def worker():
+                for _ in range(50):
+                    slugs.append(allocate('Popular title'))
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(set(slugs)), 200)
+            self.assertEqual(set(slugs), {allocate._with_suffix('popular-title', n) for n in range(1, 201)})
+
+    def test_sqlite_store_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'slugs.db')
+            store = SQLiteSlugStore(path)
+            UniqueSlugAllocator(store)('Hello World')
+            store.close()
+            store = SQLiteSlugStore(path)
+            self.assertEqual(UniqueSlugAllocator(store)('Hello World'), 'hello-world-2')
+            store.close()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        def run():
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running -= 1
+
+        self.submitted += 1
+        return super().submit(run)
+
+
+class TestAsyncio(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.executor = CountingExecutor()
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_aslugify(self):
+        r = await aslugify('Hello World', executor=self.executor, max_length=5)
+        self.assertEqual(r, 'hello')
+        self.assertEqual(self.executor.submitted, 0)
+        txt = 'Crème brûlée ' * 200
+        r = await aslugify(txt, executor=self.executor)
+        self.assertEqual(r, slugify(txt))
+        self.assertEqual(self.executor.submitted, 1)
+
+    async def test_aslugify_default_executor(self):
+        r = await aslugify('Hello World', inline_max_length=0)
+        self.assertEqual(r, 'hello-world')
+
+    async def test_aslugify_many(self):
+        async def titles():
+            for i in range(30):
+                yield 'Title {} '.format(i) * (i % 3 * 1000 + 1)
+
+        slugs = [slug async for slug in aslugify_many(titles(), executor=self.executor, concurrency=4)]
+        expected = [slugify('Title {} '.format(i) * (i % 3 * 1000 + 1)) for i in range(30)]
+        self.assertEqual(slugs, expected)
+        self.assertEqual(self.executor.submitted, 20)
+        self.assertLessEqual(self.executor.max_running, 2)
+
+    async def test_aslugify_many_pairs_and_regular_iterable(self):
+        items = [(1, 'Hello World'), (2, 'Crème ' * 1000)]
+        slugs = [slug async for slug in aslugify_many(items, executor=self.executor, separator='_')]
+        self.assertEqual(slugs, [(1, 'hello_world'), (2, slugify('Crème ' * 1000, separator='_'))])
+
+    async def test_aslugify_many_single_column_rows(self):
+        slugs = [slug async for slug in aslugify_many([('Hello World',), ('Tiny',)], executor=self.executor)]
+        self.assertEqual(slugs, ['hello-world', 'tiny'])
+
+    async def test_aslugify_many_backpressure(self):
+        consumed = []
+
+        async def titles():
+            for i in range(10):
+                consumed.append(i)
+                yield 'title {}'.format(i)
+
+        stream = aslugify_many(titles(), concurrency=3, inline_max_length=0, executor=self.executor)
+        self.assertEqual(await stream.__anext__(), 'title-0')
+        self.assertLessEqual(len(consumed), 3)
+        await stream.aclose()
+
+    def test_aslugify_many_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            aslugify_many([], concurrency=0)
+
+
+class TestSlugifyArray(unittest.TestCase):
+
+    def test_sequence(self):
+        values = ['Hello World', 'hello world', None, 'Crème', 'Hello World', b'Bytes']
+        r = slugify_array(values, separator='_')
+        self.assertEqual(r, ['hello_world', 'hello_world', None, 'creme', 'hello_world', 'bytes'])
+        self.assertEqual(slugify_array(iter(())), [])
+
+    def test_distinct_values_slugified_once(self):
+        with StageTimings() as timings:
+            r = slugify_array(['b', 'a', 'b', 'b', 'a'])
+        self.assertEqual(r, ['b', 'a', 'b', 'b', 'a'])
+        self.assertEqual(timings.calls, 2)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        values = numpy.array([['Hello World', 'Crème'], ['Hello World', 'x']])
+        r = slugify_array(values, max_length=5)
+        self.assertEqual(r.shape, (2, 2))
+        self.assertEqual(r.dtype.kind, 'U')
+        self.assertEqual(r.tolist(), [['hello', 'creme'], ['hello', 'x']])
+        r = slugify_array(values.astype(object))
+        self.assertEqual(r.dtype, object)
+        self.assertEqual(r.tolist(), [['hello-world', 'creme'], ['hello-world', 'x']])
+        self.assertEqual(slugify_array(numpy.array([b'A b', b'A b'])).tolist(), ['a-b', 'a-b'])
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed')
+    def test_pandas(self):
+        values = pandas.Series(['Hello World', None, 'Crème', 'Hello World'], index=list('abcd'), name='title')
+        r = slugify_array(values)
+        self.assertEqual(list(r.index), list('abcd'))
+        self.assertEqual(r.name, 'title')
+        self.assertEqual(r[['a', 'c', 'd']].tolist(), ['hello-world', 'creme', 'hello-world'])
+        self.assertTrue(pandas.isna(r['b']))
+        r = slugify_array(values.astype('category'))
+        self.assertEqual(r[['a', 'c', 'd']].tolist(), ['hello-world', 'creme', 'hello-world'])
+
+
+class TestSingleScanCleanup(unittest.TestCase):
+
+    CASES = [
+        "", "'", "1,000", "1','000 and 2,,3 and a,b", "it's   --- a  _test_ ", "-- trim --", "Ünïcödé  ſtraße",
+        "K\u212a İstanbul ǅemal ΑΣ", "影師嗎 ½ ² ٣", "a\u0301b \xa0 \u2000 \x85 \x1c end", "&#39;quoted&#39; &eacute;",
+        "🦄 i love 🦄", "The the THE", "tab\tnew\nline",
+    ]
+
+    def test_same_as_regex_cleanup(self):
+        for allow_unicode, pattern in [(False, slugify_module.DISALLOWED_CHARS_PATTERN),
+                                       (True, slugify_module.DISALLOWED_UNICODE_CHARS_PATTERN)]:
+            for lowercase in [True, False]:
+                options = dict(allow_unicode=allow_unicode, lowercase=lowercase, stopwords=['the', 'THE'])
+                single_scan = Slugifier(**options)
+                regex = Slugifier(regex_pattern=pattern, **options)
+                self.assertIsNotNone(single_scan._cleanup_table)
+                self.assertIsNone(regex._cleanup_table)
+                for txt in self.CASES:
+                    self.assertEqual(single_scan(txt), regex(txt), (txt, options))
+
+    def test_table_size_is_bounded(self):
+        table = slugify_module._CleanupTable(allow_unicode=True)
+        self.assertEqual(table[ord('影')], '影')
+        ''.join(map(chr, range(0x10000, 0x10000 + 2 * slugify_module.CLEANUP_TABLE_MAX_SIZE))).translate(table)
+        self.assertEqual(len(table), slugify_module.CLEANUP_TABLE_MAX_SIZE)
+        self.assertEqual(table[ord('é')], 'é')
+        self.assertEqual(table[ord('-')], ' ')
+        self.assertEqual(table[ord("'")], '')
+
+
+class TestIsSlug(unittest.TestCase):
+
+    CASES = [
+        ('', {}), ('hello-world', {}), ('Hello-world', {}), ('hello--world', {}), ('-hello', {}),
+        ('hello world', {}), ('hello_world', {'separator': '_'}), ('hello-world', {'separator': '_'}),
+        ('helloworld', {'separator': ''}), ('hello__world', {'separator': '__'}), ('1000', {}), ('1,000', {}),
+        ('Hello-World', {'lowercase': False}), ('hello-the-world', {'stopwords': ['the']}),
+        ('hello-world', {'stopwords': ['the']}), ('hello-world', {'max_length': 11}),
+        ('hello-world', {'max_length': 10}), ('hello-world', {'max_length': 11, 'word_boundary': True}),
+        ('hello__world', {'separator': '__', 'max_length': 11}), ('影師嗎-東京', {'allow_unicode': True}),
+        ('影師嗎-東京', {}), ('straße-i̇', {'allow_unicode': True}), ('Straße', {'allow_unicode': True}),
+        ('ｶﾀｶﾅ', {'allow_unicode': True}), ('café', {'allow_unicode': True}),
+        ('hello-world', {'replacements': [['hello', 'hi']]}), ('a-b', {'replacements': [['a-b', 'x']], 'separator': '_'}),
+        ('a_b', {'replacements': [['a-b', 'x']], 'separator': '_'}), ('hello-world', {'replacements': [['x', 'y']]}),
+        ('hello-world', {'regex_pattern': r'[^-a-z]+'}), ('helloxworld', {'separator': 'x'}),
+        ('hello,world', {'separator': ','}), ('uber', {'pre_translations': 'german'}),
+    ]
+
+    def test_same_as_slugify(self):
+        for txt, options in self.CASES:
+            self.assertEqual(is_slug(txt, **options), slugify(txt, **options) == txt, (txt, options))
+
+    def test_fast_check(self):
+        slugifier = Slugifier(separator='_', max_length=20, stopwords=['the'])
+        self.assertTrue(slugifier._known_slug('quick_brown_fox'))
+        self.assertIs(slugifier._known_slug('the_quick_fox'), False)
+        self.assertIs(slugifier._known_slug('The quick fox'), False)
+        self.assertIsNone(Slugifier(separator='x')._known_slug('quick'))
+        self.assertIsNone(Slugifier(regex_pattern=r'[^a-z]+')._known_slug('quick'))
+
+    def test_slugify_returns_slugs_as_they_are(self):
+        slugifier = Slugifier(allow_unicode=True)
+        txt = '東京都-天気予報'
+        self.assertIs(slugifier(txt), txt)
+        with StageTimings() as timings:
+            slugifier(txt)
+        self.assertEqual(set(timings.counts), {'is_slug'})
+
+    def test_empty_separator(self):
+        self.assertIsNone(Slugifier(separator='')._slug_pattern)
+        txt = 'a' * 5000 + '!'
+        self.assertEqual(slugify(txt, separator=''), 'a' * 5000)
+        self.assertFalse(is_slug(txt, separator=''))
+        self.assertTrue(is_slug('abc', separator=''))
+
+    def test_not_text(self):
+        self.assertFalse(is_slug(b'hello'))
+        self.assertEqual(slugify(b'hello'), 'hello')
+
+
 class TestUtils(unittest.TestCase):
 
     def test_smart_truncate_no_max_length(self):
@@ -540,6 +1547,31 @@ class TestUtils(unittest.TestCase):
         r = smart_truncate(txt, max_length=100, separator='_')
         self.assertEqual(r, txt)
 
+    def test_smart_truncate_word_boundary(self):
+        txt = 'one two three four five'
+        self.assertEqual(smart_truncate(txt, 13, True), 'one two three')
+        self.assertEqual(smart_truncate(txt, 12, True), 'one two four')
+        self.assertEqual(smart_truncate(txt, 12, True, save_order=True), 'one two')
+        self.assertEqual(smart_truncate('  one  two  ', 8, True), 'one two')
+        self.assertEqual(smart_truncate('averyverylongword tiny', 5, True), 'tiny')
+        self.assertEqual(smart_truncate('averyverylongword tiny', 5, True, save_order=True), 'avery')
+
+    def test_smart_truncate_empty_separator(self):
+        self.assertEqual(smart_truncate('abc def', 3, separator=''), 'abc')
+        with self.assertRaises(ValueError):
+            smart_truncate('abc def', 3, True, '')
+
+    def test_smart_truncate_multi_character_separator(self):
+        txt = 'one--two--three--four'
+        self.assertEqual(smart_truncate(txt, 13, True, '--'), 'one--two')
+        self.assertEqual(smart_truncate(txt, 14, True, '--'), 'one--two--four')
+        self.assertEqual(smart_truncate(txt, 15, True, '--'), 'one--two--three')
+
+    def test_smart_truncate_large_input(self):
+        txt = ' '.join(['word'] * 1000000)
+        self.assertEqual(smart_truncate(txt, 12, True), 'word word')
+        self.assertEqual(smart_truncate(txt, 14, True, save_order=True), 'word word word')
+
 
 PY3 = sys.version_info.major == 3
 
@@ -554,6 +1586,16 @@ def captured_stderr():
         sys.stderr = backup
 
 
+@contextmanager
+def captured_stdout():
+    backup = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        yield sys.stdout
+    finally:
+        sys.stdout = backup
+
+
 @contextmanager
 def loaded_stdin(contents):
     backup = sys.stdin
@@ -574,8 +1616,10 @@ class TestCommandParams(unittest.TestCase):
         'save_order': False,
         'separator': '-',
         'stopwords': None,
+        'regex_pattern': None,
         'lowercase': True,
-        'replacements': None
+        'replacements': None,
+        'pre_translations': []
     }
 
     def get_params_from_cli(self, *argv):
@@ -645,6 +1689,109 @@ class TestCommandParams(unittest.TestCase):
         self.assertEqual(err.exception.code, 2)
         self.assertIn("Input strings and --stdin cannot work together", cse.getvalue())
 
+    def test_lines(self):
+        with loaded_stdin("Hello World\n\nCrème brûlée\nlast"), captured_stdout() as cso:
+            main([None, '--lines', '--separator', '_'])
+        self.assertEqual(cso.getvalue(), 'hello_world\n\ncreme_brulee\nlast\n')
+
+    def test_null(self):
+        with loaded_stdin("Hello\nWorld\0Cool Text\0"), captured_stdout() as cso:
+            main([None, '-z'])
+        self.assertEqual(cso.getvalue(), 'hello-world\0cool-text\0')
+
+    def test_jobs(self):
+        text = ''.join('Title {}\n'.format(i) for i in range(2500))
+        with loaded_stdin(text), captured_stdout() as cso:
+            main([None, '--lines', '--jobs', '2', '--separator', '_'])
+        self.assertEqual(cso.getvalue(), ''.join('title_{}\n'.format(i) for i in range(2500)))
+
+    def test_jobs_errors(self):
+        for argv, message in [(('--jobs', '2', 'Text'), "--jobs only works with --lines or --null"),
+                              (('--lines', '--jobs', '-1'), "--jobs must not be negative")]:
+            with self.assertRaises(SystemExit) as err, captured_stderr() as cse:
+                self.get_params_from_cli(*argv)
+            self.assertEqual(err.exception.code, 2)
+            self.assertIn(message, cse.getvalue())
+
+    def test_csv(self):
+        text = 'id,title,body\n1,Hello World,"multi\nline, body"\n2,Crème brûlée,x\n3,,y\n'
+        with loaded_stdin(text), captured_stdout() as cso:
+            main([None, '--format', 'csv', '--fields', 'title', 'body', '--max-length', '8'])
+        self.assertEqual(cso.getvalue().splitlines(), [
+            'id,title,body,title_slug,body_slug', '1,Hello World,"multi', 'line, body",hello-wo,multi-li',
+            '2,Crème brûlée,x,creme-br,x', '3,,y,,y'])
+
+    def test_csv_regex_pattern(self):
+        with loaded_stdin('id,title\n1,Version 2.0 notes\n'), captured_stdout() as cso:
+            main([None, '--format', 'csv', '--fields', 'title', '--regex-pattern', r'[^-a-z0-9.]+'])
+        self.assertEqual(cso.getvalue().splitlines(), ['id,title,title_slug', '1,Version 2.0 notes,version-2.0-notes'])
+
+    def test_csv_too_many_fields(self):
+        with loaded_stdin('a,b\n1,2\n3,4,5\n'), captured_stdout() as cso, self.assertRaises(SystemExit) as err:
+            main([None, '--format', 'csv', '--fields', 'a'])
+        self.assertEqual(err.exception.code, 'slugify: line 3: too many fields')
+        self.assertEqual(cso.getvalue().splitlines(), ['a,b,a_slug', '1,2,1'])
+
+    def test_csv_unknown_column(self):
+        with loaded_stdin('a,b\n1,2\n'), captured_stdout(), self.assertRaises(SystemExit) as err:
+            main([None, '--format', 'csv', '--fields', 'c'])
+        self.assertEqual(err.exception.code, 'slugify: unknown column(s): c')
+
+    def test_jsonl(self):
+        text = '{"title": "Hello World", "n": 5}\n\n{"title": null}\n'
+        with loaded_stdin(text), captured_stdout() as cso:
+            main([None, '--format', 'jsonl', '--fields', 'title', 'n', '--separator', '_'])
+        self.assertEqual(cso.getvalue(), (
+            '{"title": "Hello World", "n": 5, "title_slug": "hello_world", "n_slug": "5"}\n'
+            '{"title": null, "title_slug": null, "n_slug": null}\n'))
+        with loaded_stdin('{"title": "Crème"}\n'), captured_stdout() as cso:
+            main([None, '--format', 'jsonl', '--fields', 'title', '--output-field', '{field}'])
+        self.assertEqual(cso.getvalue(), '{"title": "creme"}\n')
+
+    def test_jsonl_errors(self):
+        for text, message in [('{}\n[1]\n', 'slugify: line 2: not a JSON object'),
+                              ('{"a": \n', 'slugify: line 1: Expecting value')]:
+            with loaded_stdin(text), captured_stdout(), self.assertRaises(SystemExit) as err:
+                main([None, '--format', 'jsonl', '--fields', 'a'])
+            self.assertTrue(err.exception.code.startswith(message))
+
+    def test_format_errors(self):
+        for argv, message in [(('--format', 'csv'), "--format and --fields must be used together"),
+                              (('--fields', 'a'), "--format and --fields must be used together"),
+                              (('--format', 'csv', '--fields', 'a', '--lines'), "--format reads STDIN"),
+                              (('--format', 'csv', '--fields', 'a', 'b', '--output-field', 'slug'),
+                               "--output-field must contain {field}")]:
+            with self.assertRaises(SystemExit) as err, captured_stderr() as cse:
+                self.get_params_from_cli(*argv)
+            self.assertEqual(err.exception.code, 2)
+            self.assertIn(message, cse.getvalue())
+
+    def test_lines_with_text_fails(self):
+        for argv in [('--lines', 'Text'), ('--null', 'Text'), ('--lines', '--stdin')]:
+            with self.assertRaises(SystemExit) as err, captured_stderr() as cse:
+                self.get_params_from_cli(*argv)
+            self.assertEqual(err.exception.code, 2)
+            self.assertIn("cannot work with input strings or --stdin", cse.getvalue())
+
+    def test_read_records(self):
+        for size in [1, 2, 3, 100]:
+            records = list(read_records(io.StringIO('ab\0\0cdef\0g'), '\0', size))
+            self.assertEqual(records, ['ab', '', 'cdef', 'g'])
+            records = list(read_records(io.StringIO('ab\ncd\n'), '\n', size))
+            self.assertEqual(records, ['ab', 'cd'])
+        self.assertEqual(list(read_records(io.StringIO(''), '\n')), [])
+
+    def test_pre_translations(self):
+        params = self.get_params_from_cli('--pre-translations', 'german', 'greek', '--', 'Über')
+        self.assertEqual(params['pre_translations'], ['german', 'greek'])
+        self.assertEqual(slugify(**params), 'ueber')
+
+    def test_pre_translations_unknown(self):
+        with self.assertRaises(SystemExit) as err, captured_stderr() as cse:
+            self.get_params_from_cli('--pre-translations', 'german', 'klingon', '--', 'foo')
+        self.assertEqual(err.exception.code, 2)
+        self.assertIn("Unknown language profile(s): klingon, expected some of: ", cse.getvalue())
+
     def test_multivalued_options_with_text(self):
         text = "the quick brown fox jumps over the lazy dog in a hurry"
         cli_args = "--stopwords the in a hurry -- {}".format(text).split()